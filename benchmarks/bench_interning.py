@@ -0,0 +1,123 @@
+"""Замер памяти каталога с интернированием повторяющихся атрибутов и без него.
+
+Синтетический каталог смартфонов и газонной травы проходит через JSON, как при
+загрузке из файла, поэтому каждое значение атрибута приходит отдельной строкой.
+Сравниваются текущие классы, которые хранят одинаковые значения в одном
+экземпляре, и их копии, сохраняющие исходные строки без интернирования.
+Учитывается вся удерживаемая память: объекты и строки их атрибутов.
+
+Запуск из корня проекта: python -m benchmarks.bench_interning [количество]
+"""
+
+import json
+import random
+import sys
+import tracemalloc
+
+from src.products import LawnGrass, Smartphone
+
+COLORS = ("Серый", "Синий", "Черный", "Gray space", "Зеленый", "Белый")
+COUNTRIES = ("Россия", "США", "Германия", "Нидерланды")
+PERIODS = ("7 дней", "10 дней", "14 дней", "21 день")
+DESCRIPTIONS = (
+    "Элитная трава для газона",
+    "Неприхотливая трава для дачи",
+    "Спортивный газон повышенной прочности",
+)
+
+
+class PlainSmartphone(Smartphone):
+    """Smartphone, который хранит полученные строки как есть."""
+
+    __slots__ = ()
+
+    def __init__(self, name, description, price, quantity, efficiency, model, memory, color):
+        super().__init__(name, description, price, quantity, efficiency, model, memory, color)
+        self.description = description
+        self.model = model
+        self.color = color
+
+
+class PlainLawnGrass(LawnGrass):
+    """LawnGrass, который хранит полученные строки как есть."""
+
+    __slots__ = ()
+
+    def __init__(self, name, description, price, quantity, country, germination_period, color):
+        super().__init__(name, description, price, quantity, country, germination_period, color)
+        self.description = description
+        self.country = country
+        self.germination_period = germination_period
+        self.color = color
+
+
+def synthetic_json(count, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        if index % 2:
+            records.append(
+                [
+                    "smartphone",
+                    f"Смартфон {index}",
+                    f"{rng.choice((128, 256, 512))}GB, {rng.choice(COLORS)}",
+                    float(rng.randint(10_000, 300_000)),
+                    rng.randint(1, 50),
+                    round(rng.uniform(80, 100), 1),
+                    f"Модель {rng.randint(1, 20)}",
+                    rng.choice((128, 256, 512)),
+                    rng.choice(COLORS),
+                ]
+            )
+        else:
+            records.append(
+                [
+                    "lawn_grass",
+                    f"Газонная трава {index}",
+                    rng.choice(DESCRIPTIONS),
+                    float(rng.randint(100, 5_000)),
+                    rng.randint(1, 50),
+                    rng.choice(COUNTRIES),
+                    rng.choice(PERIODS),
+                    rng.choice(COLORS),
+                ]
+            )
+    return json.dumps(records, ensure_ascii=False)
+
+
+def retained_bytes(text, classes):
+    """Память, которую удерживают товары, построенные из JSON-текста."""
+    smartphone_cls, lawn_grass_cls = classes
+    tracemalloc.start()
+    records = json.loads(text)
+    products = [
+        smartphone_cls(*record[1:]) if record[0] == "smartphone" else lawn_grass_cls(*record[1:])
+        for record in records
+    ]
+    del records
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del products
+    return retained
+
+
+def run(count=100_000):
+    text = synthetic_json(count)
+    before = retained_bytes(text, (PlainSmartphone, PlainLawnGrass))
+    after = retained_bytes(text, (Smartphone, LawnGrass))
+    return {"count": count, "before": before, "after": after}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 100_000
+    row = run(count)
+    saving = 1 - row["after"] / row["before"]
+    print(f"Товаров: {row['count']}")
+    print(f"Без интернирования: {row['before'] / 2**20:.1f} МБ ({row['before'] / count:.0f} байт на товар)")
+    print(f"С интернированием:  {row['after'] / 2**20:.1f} МБ ({row['after'] / count:.0f} байт на товар)")
+    print(f"Экономия: {saving:.0%}")
+
+
+if __name__ == "__main__":
+    main()
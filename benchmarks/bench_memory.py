@@ -0,0 +1,88 @@
+"""Замер памяти на один товар: слоты против прежнего представления с __dict__.
+
+Запуск из корня проекта: python -m benchmarks.bench_memory [количество]
+"""
+
+import sys
+import tracemalloc
+
+from src.products import LawnGrass, Product, Smartphone
+
+
+class DictProduct:
+    """Прежняя раскладка Product: все поля в __dict__ объекта."""
+
+    def __init__(self, name, description, price, quantity):
+        self.name = name
+        self.description = description
+        self._Product__price = price
+        self.quantity = quantity
+
+
+class DictSmartphone(DictProduct):
+    def __init__(self, name, description, price, quantity, efficiency, model, memory, color):
+        super().__init__(name, description, price, quantity)
+        self.efficiency = efficiency
+        self.model = model
+        self.memory = memory
+        self.color = color
+
+
+class DictLawnGrass(DictProduct):
+    def __init__(self, name, description, price, quantity, country, germination_period, color):
+        super().__init__(name, description, price, quantity)
+        self.length = None
+        self.country = country
+        self.germination_period = germination_period
+        self.color = color
+
+
+CASES = [
+    ("Product", DictProduct, Product, ("Iphone 15", "512GB, Gray space", 210000.0, 8)),
+    (
+        "Smartphone",
+        DictSmartphone,
+        Smartphone,
+        ("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+    ),
+    (
+        "LawnGrass",
+        DictLawnGrass,
+        LawnGrass,
+        ("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый"),
+    ),
+]
+
+
+def bytes_per_object(cls, args, count):
+    """Средний объем памяти на объект; аргументы общие, поэтому учитываются только сами объекты."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(*args) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # Вычитаем сам список со ссылками на объекты
+    return (after - before) / count - 8
+
+
+def run(count=100_000):
+    results = []
+    for name, legacy_cls, slotted_cls, args in CASES:
+        before = bytes_per_object(legacy_cls, args, count)
+        after = bytes_per_object(slotted_cls, args, count)
+        results.append({"class": name, "before": before, "after": after})
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 100_000
+    print(f"{'Класс':<12}{'__dict__, байт':>16}{'__slots__, байт':>17}{'Экономия':>10}")
+    for row in run(count):
+        saving = 1 - row["after"] / row["before"]
+        print(f"{row['class']:<12}{row['before']:>16.1f}{row['after']:>17.1f}{saving:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
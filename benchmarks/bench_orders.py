@@ -0,0 +1,68 @@
+"""Нагрузочный тест OrderEngine: много потоков оформляют заказы одновременно.
+
+Запуск из корня проекта: python -m benchmarks.bench_orders [потоки] [заказов_на_поток] [товаров]
+"""
+
+import random
+import sys
+import threading
+import time
+
+from src.orders import OrderEngine, OutOfStockError
+from src.products import Category, Product
+
+
+def run(threads=8, orders_per_thread=20_000, products=100, stock=1_000):
+    category = Category("Нагрузка", "Синтетические товары", [])
+    items = [Product(f"Товар {index}", "Синтетический товар", 100.0, stock) for index in range(products)]
+    for item in items:
+        category.add_product(item)
+    engine = OrderEngine()
+    sold = [0] * threads
+
+    def worker(number):
+        rng = random.Random(number)
+        for _ in range(orders_per_thread):
+            try:
+                sold[number] += engine.place(rng.choice(items), rng.randint(1, 3)).quantity
+            except OutOfStockError:
+                pass
+
+    workers = [threading.Thread(target=worker, args=(number,)) for number in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    remaining = [item.quantity for item in items]
+    if min(remaining) < 0:
+        raise AssertionError("Остаток ушел в минус")
+    if sum(remaining) + sum(sold) != products * stock:
+        raise AssertionError("Проданное и оставшееся не сходятся с начальным остатком")
+    if category.total_quantity() != sum(remaining):
+        raise AssertionError("Итоги категории разошлись с остатками товаров")
+    return {
+        "threads": threads,
+        "attempts": threads * orders_per_thread,
+        "placed": engine.placed_count,
+        "rejected": engine.rejected_count,
+        "seconds": elapsed,
+        "orders_per_second": threads * orders_per_thread / elapsed,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = [int(value) for value in argv]
+    result = run(*args)
+    print(
+        f"Потоков: {result['threads']}, попыток: {result['attempts']}, оформлено: {result['placed']}, "
+        f"отклонено: {result['rejected']}, {result['orders_per_second']:.0f} заказов/с"
+    )
+    print("Остатки не ушли в минус, проданное сходится с начальным остатком")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Набор замеров производительности основной модели магазина.
+
+Для каждого размера синтетического каталога (по умолчанию 10^3 … 10^6 товаров)
+замеряются создание товаров, Category.add_product, слияние через Product.new_product,
+загрузка JSON, get_average_price, отрисовка Category.products, создание Order,
+запись заказов в журнал и подсчет выручки по нему.
+Результаты (время, операций в секунду, пиковая память) пишутся в JSON-файл,
+чтобы сравнивать прогоны между собой.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_suite --sizes 1000 10000 --output bench_results.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src import utils
+from src.ledger import LedgerReader, OrderLedger
+from src.products import Category, Order, Product
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# Слияние перебором списка квадратично, поэтому замеряется только на малых размерах
+LINEAR_MERGE_LIMIT = 10_000
+PRODUCTS_PER_CATEGORY = 1_000
+
+
+def synthetic_records(size, seed=0):
+    rng = random.Random(seed)
+    colors = ("Серый", "Синий", "Черный", "Gray space", "Зеленый")
+    return [
+        {
+            "name": f"Товар {index}",
+            "description": f"{rng.choice((128, 256, 512, 1024))}GB, {rng.choice(colors)}",
+            "price": float(rng.randint(100, 300_000)),
+            "quantity": rng.randint(1, 50),
+        }
+        for index in range(size)
+    ]
+
+
+def make_products(records):
+    return [Product(record["name"], record["description"], record["price"], record["quantity"]) for record in records]
+
+
+def make_category(products):
+    category = Category("Синтетика", "Синтетическая категория", [])
+    for product in products:
+        category.add_product(product)
+    return category
+
+
+def write_catalog(records, path):
+    categories = [
+        {
+            "name": f"Категория {start // PRODUCTS_PER_CATEGORY}",
+            "description": "Синтетическая категория",
+            "products": records[start:start + PRODUCTS_PER_CATEGORY],
+        }
+        for start in range(0, len(records), PRODUCTS_PER_CATEGORY)
+    ]
+    with open(path, "w", encoding="UTF-8") as file:
+        json.dump(categories, file, ensure_ascii=False)
+
+
+def case_construct(records, workdir):
+    return lambda: make_products(records)
+
+
+def case_add_product(records, workdir):
+    products = make_products(records)
+    return lambda: make_category(products)
+
+
+def case_new_product_index(records, workdir):
+    # Половина записей — повторы уже известных товаров
+    batch = records + records[: len(records) // 2]
+    return lambda: Product.new_products(batch)
+
+
+def case_new_product_list(records, workdir):
+    if len(records) > LINEAR_MERGE_LIMIT:
+        return None
+    existing = make_products(records)
+    updates = records[::2]
+    return lambda: [Product.new_product(record, existing) for record in updates]
+
+
+def case_load_json(records, workdir):
+    path = os.path.join(workdir, f"catalog_{len(records)}.json")
+    write_catalog(records, path)
+
+    def run():
+        for category_info in utils.load_json(path):
+            category = Category(category_info["name"], category_info["description"], [])
+            for product in Product.new_products(category_info["products"]):
+                category.add_product(product)
+
+    return run
+
+
+def case_stream_json(records, workdir):
+    path = os.path.join(workdir, f"catalog_{len(records)}.json")
+    if not os.path.exists(path):
+        write_catalog(records, path)
+    return lambda: sum(1 for _ in utils.iter_categories(path))
+
+
+def case_average_price(records, workdir):
+    category = make_category(make_products(records))
+    return lambda: [category.get_average_price() for _ in range(len(records))]
+
+
+def case_render_products(records, workdir):
+    products = make_products(records)
+
+    def run():
+        # Новая категория на каждый прогон: замеряется полная отрисовка, а не кэш
+        return len(make_category(products).products)
+
+    return run
+
+
+def case_order(records, workdir):
+    products = make_products(records)
+    return lambda: [Order(product, 1) for product in products]
+
+
+def case_ledger_append(records, workdir):
+    orders = [Order(product, 1) for product in make_products(records)]
+    path = os.path.join(workdir, f"orders_{len(records)}.ledger")
+
+    def run():
+        if os.path.exists(path):
+            os.remove(path)
+        with OrderLedger(path, durable=False) as ledger:
+            for order in orders:
+                ledger.append(order)
+
+    return run
+
+
+def case_ledger_revenue(records, workdir):
+    path = os.path.join(workdir, f"orders_{len(records)}.ledger")
+    case_ledger_append(records, workdir)()
+
+    def run():
+        with LedgerReader(path) as reader:
+            return reader.revenue()
+
+    return run
+
+
+# Имя замера -> (подготовка, число операций на прогон относительно размера)
+CASES = {
+    "construct_products": (case_construct, 1),
+    "category_add_product": (case_add_product, 1),
+    "new_products_index_merge": (case_new_product_index, 1.5),
+    "new_product_list_merge": (case_new_product_list, 0.5),
+    "load_json_ingest": (case_load_json, 1),
+    "stream_json_ingest": (case_stream_json, 1),
+    "get_average_price": (case_average_price, 1),
+    "render_products": (case_render_products, 1),
+    "order_creation": (case_order, 1),
+    "ledger_append": (case_ledger_append, 1),
+    "ledger_revenue_scan": (case_ledger_revenue, 1),
+}
+
+
+def measure(run):
+    """Время одного прогона без трассировки памяти и пиковая память отдельного прогона."""
+    gc.collect()
+    started = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def run_suite(sizes=DEFAULT_SIZES, cases=None, workdir=None):
+    selected = cases or list(CASES)
+    results = []
+    saved_counts = Category.category_count, Category.product_count
+    with tempfile.TemporaryDirectory(dir=workdir) as directory:
+        for size in sizes:
+            records = synthetic_records(size)
+            for name in selected:
+                setup, operations_factor = CASES[name]
+                run = setup(records, directory)
+                if run is None:
+                    results.append({"case": name, "size": size, "skipped": True})
+                    continue
+                seconds, peak = measure(run)
+                operations = int(size * operations_factor)
+                results.append(
+                    {
+                        "case": name,
+                        "size": size,
+                        "operations": operations,
+                        "seconds": seconds,
+                        "ops_per_second": operations / seconds if seconds else None,
+                        "peak_memory_bytes": peak,
+                    }
+                )
+    Category.category_count, Category.product_count = saved_counts
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности модели магазина")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=list(CASES))
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.cases)
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="UTF-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+    for row in results:
+        if row.get("skipped"):
+            print(f"{row['case']:<26}{row['size']:>10}  пропущено")
+        else:
+            print(
+                f"{row['case']:<26}{row['size']:>10}{row['ops_per_second']:>14.0f} оп/с"
+                f"{row['peak_memory_bytes'] / 2**20:>10.1f} МБ"
+            )
+    print(f"Результаты записаны в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import threading
+
+from src.products import Category, ProductIndex
+
+
+class Catalog:
+    """Каталог магазина: владеет своими категориями и ведет собственные счетчики.
+
+    В отличие от атрибутов класса Category.category_count и Category.product_count,
+    счетчики каталога не общие для всего процесса, поэтому в одном процессе могут
+    работать несколько независимых каталогов. Поиск категории и товара по имени
+    выполняется через словари за O(1), без перебора категорий.
+    """
+
+    def __init__(self, categories=()):
+        self.__lock = threading.RLock()
+        self.__categories = {}  # имя -> Category
+        self.__products = ProductIndex()  # имя -> Product
+        self.__product_categories = {}  # имя товара -> Category, в которую он добавлен первым
+        self.__occurrences = {}  # id(product) -> число вхождений товара в категории каталога
+        self.__category_count = 0
+        self.__product_count = 0
+        for category in categories:
+            self.add_category(category)
+
+    def add_category(self, category):
+        if not isinstance(category, Category):
+            raise TypeError(f"Невозможно добавить объект типа {type(category).__name__}. Ожидается Category.")
+        with self.__lock:
+            if category.name in self.__categories:
+                raise ValueError(f"Категория {category.name} уже есть в каталоге")
+            self.__categories[category.name] = category
+            self.__category_count += 1
+            for product in category:
+                self.__register_product(category, product)
+            category.subscribe(self._on_category_event)
+        return category
+
+    def add_product(self, category_name, product):
+        """Добавляет товар в категорию каталога по ее имени."""
+        with self.__lock:
+            self.__categories[category_name].add_product(product)
+        return product
+
+    def _on_category_event(self, category, event, product):
+        with self.__lock:
+            if event == "add":
+                self.__register_product(category, product)
+            elif event == "remove":
+                self.__unregister_product(category, product)
+
+    def __register_product(self, category, product):
+        self.__product_count += 1
+        self.__occurrences[id(product)] = self.__occurrences.get(id(product), 0) + 1
+        if self.__products.add(product) is product:
+            self.__product_categories.setdefault(product.name, category)
+
+    def __unregister_product(self, category, product):
+        self.__product_count -= 1
+        occurrences = self.__occurrences.pop(id(product)) - 1
+        if occurrences:
+            self.__occurrences[id(product)] = occurrences
+            # Товар остался в других категориях: ссылка переносится на одну из них
+            if self.__product_categories.get(product.name) is category and product not in category:
+                for other in self.__categories.values():
+                    if product in other:
+                        self.__product_categories[product.name] = other
+                        break
+            return
+        if self.__products.remove(product):
+            del self.__product_categories[product.name]
+            # Имя может остаться за другим товаром в другой категории
+            for category in self.__categories.values():
+                replacement = category.find_product(product.name)
+                if replacement is not None:
+                    self.__products.add(replacement)
+                    self.__product_categories[product.name] = category
+                    break
+
+    def get_category(self, name, default=None):
+        return self.__categories.get(name, default)
+
+    def get_product(self, name, default=None):
+        return self.__products.get(name, default)
+
+    def category_of(self, product_name, default=None):
+        """Возвращает категорию, в которой находится товар с указанным именем."""
+        return self.__product_categories.get(product_name, default)
+
+    @property
+    def category_count(self):
+        with self.__lock:
+            return self.__category_count
+
+    @property
+    def product_count(self):
+        with self.__lock:
+            return self.__product_count
+
+    def __contains__(self, name):
+        return name in self.__categories
+
+    def __len__(self):
+        return len(self.__categories)
+
+    def __iter__(self):
+        """Перебирает категории каталога в порядке добавления."""
+        with self.__lock:
+            return iter(list(self.__categories.values()))
@@ -0,0 +1,197 @@
+"""Командная строка магазина: store load | report | search | reprice | bench.
+
+Каталог задается JSON-файлом (или несколькими файлами-шардами) либо двоичным
+снимком из src.snapshot. Модули магазина импортируются внутри подкоманд, только
+когда они нужны, поэтому запуск и отчет по готовому снимку не тратят время на
+лишние импорты, а отчет считается по колонкам снимка без создания товаров.
+
+Примеры:
+    python store.py load data/products.json --snapshot catalog.snap
+    python store.py report catalog.snap
+    python store.py search catalog.snap "iphone 15"
+    python store.py reprice catalog.snap --percent -10 --category Смартфоны --output catalog.snap
+    python store.py bench --sizes 1000 10000
+"""
+
+import argparse
+import time
+
+
+def _is_snapshot(path):
+    from src.snapshot import MAGIC
+
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def _load(paths, processes=None):
+    """Категории из снимка (SnapshotCategory) или из JSON; для снимка возвращается и сам Snapshot."""
+    if len(paths) == 1 and _is_snapshot(paths[0]):
+        from src.snapshot import Snapshot
+
+        snapshot = Snapshot(paths[0])
+        return snapshot, snapshot.categories()
+
+    from src import utils
+
+    if len(paths) == 1:
+        return None, utils.load_categories(paths[0])
+    return None, utils.load_shards(paths, processes)
+
+
+def _materialize(categories):
+    return [category.to_category() if hasattr(category, "to_category") else category for category in categories]
+
+
+def _product_line(product):
+    return f"{product.name}, {product.price} руб. Остаток: {product.quantity} шт."
+
+
+def command_load(args):
+    started = time.perf_counter()
+    snapshot, categories = _load(args.catalog, args.processes)
+    try:
+        product_count = sum(len(category) for category in categories)
+        print(f"Категорий: {len(categories)}, товаров: {product_count}")
+        if args.snapshot:
+            from src.snapshot import write_snapshot
+
+            write_snapshot(args.snapshot, categories)
+            print(f"Снимок записан в {args.snapshot}")
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+    print(f"Готово за {time.perf_counter() - started:.3f} с")
+
+
+def command_report(args):
+    snapshot, categories = _load(args.catalog, args.processes)
+    try:
+        print(f"{'Категория':<30}{'Товаров':>10}{'Остаток, шт.':>14}{'Средняя цена':>16}{'Стоимость запаса':>20}")
+        for category in categories:
+            print(
+                f"{category.name:<30}{len(category):>10}{category.total_quantity():>14}"
+                f"{category.get_average_price():>16.2f}{category.stock_value():>20.2f}"
+            )
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+
+
+def command_search(args):
+    from src.search import SearchIndex
+
+    snapshot, categories = _load(args.catalog, args.processes)
+    try:
+        index = SearchIndex(_materialize(categories))
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+    products = index.search(args.query, limit=args.limit)
+    for product in products:
+        print(_product_line(product))
+    if not products:
+        print("Ничего не найдено")
+
+
+def _policy(args):
+    from src.repricing import AutoApprove, RejectDecreases, ThresholdPolicy
+
+    if args.max_decrease is not None:
+        return ThresholdPolicy(args.max_decrease)
+    if args.no_decrease:
+        return RejectDecreases()
+    return AutoApprove()
+
+
+def command_reprice(args):
+    from src.repricing import reprice
+
+    snapshot, categories = _load(args.catalog, args.processes)
+    try:
+        categories = _materialize(categories)
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+    selected = [category for category in categories if args.category is None or category.name == args.category]
+    if not selected:
+        raise ValueError(f"Категория {args.category} не найдена")
+
+    policy = _policy(args)
+    products = [product for category in selected for product in category]
+    report = reprice(products, percent=args.percent, amount=args.amount, policy=policy)
+    for product, old_price, new_price in report.applied:
+        print(f"{product.name}: {old_price} -> {new_price}")
+    for product, old_price, new_price, reason in report.rejected:
+        print(f"{product.name}: {old_price} -> {new_price} отклонено ({reason})")
+    print(report)
+
+    if args.output:
+        from src.snapshot import write_snapshot
+
+        write_snapshot(args.output, categories)
+        print(f"Снимок записан в {args.output}")
+    else:
+        print("Изменения не сохранены: укажите --output, чтобы записать снимок")
+
+
+def command_bench(args):
+    from benchmarks import bench_suite
+
+    bench_suite.main(args.bench_args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="store", description="Работа с каталогом магазина")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_catalog(subparser):
+        subparser.add_argument("catalog", nargs="+", help="JSON-файл, несколько файлов-шардов или снимок")
+        subparser.add_argument("--processes", type=int, help="число процессов для загрузки шардов")
+
+    load = subparsers.add_parser("load", help="загрузить каталог и при необходимости записать снимок")
+    add_catalog(load)
+    load.add_argument("--snapshot", help="путь к снимку для быстрого старта")
+    load.set_defaults(handler=command_load)
+
+    report = subparsers.add_parser("report", help="сводка по категориям")
+    add_catalog(report)
+    report.set_defaults(handler=command_report)
+
+    search = subparsers.add_parser("search", help="поиск товаров")
+    search.add_argument("catalog", help="JSON-файл или снимок")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=10)
+    search.set_defaults(handler=command_search, processes=None)
+
+    reprice = subparsers.add_parser("reprice", help="переоценка товаров")
+    add_catalog(reprice)
+    change = reprice.add_mutually_exclusive_group(required=True)
+    change.add_argument("--percent", type=float, help="изменение в процентах, например -10")
+    change.add_argument("--amount", type=float, help="изменение на сумму")
+    reprice.add_argument("--category", help="переоценить только эту категорию")
+    reprice.add_argument("--no-decrease", action="store_true", help="отклонять снижение цен")
+    reprice.add_argument("--max-decrease", type=float, help="допустимое снижение цены, доля от 0 до 1")
+    reprice.add_argument("--output", help="записать результат в снимок")
+    reprice.set_defaults(handler=command_reprice)
+
+    bench = subparsers.add_parser("bench", help="замеры производительности (аргументы benchmarks.bench_suite)")
+    bench.set_defaults(handler=command_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # Неизвестные аргументы bench передаются в benchmarks.bench_suite как есть
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = extra
+    elif extra:
+        parser.error(f"нераспознанные аргументы: {' '.join(extra)}")
+    if args.command == "search":
+        args.catalog = [args.catalog]
+    try:
+        args.handler(args)
+    except (OSError, TypeError, ValueError) as error:
+        parser.exit(1, f"store: ошибка: {error}\n")
+    return 0
@@ -0,0 +1,81 @@
+"""Мост между Category и колоночными форматами: DataFrame pandas и таблица Arrow.
+
+pandas и pyarrow импортируются только при вызове соответствующих функций,
+поэтому импорт магазина не зависит от них. Цены и остатки передаются целыми
+колонками из Category.columns(): в Arrow — без копирования, через буфер массива,
+в pandas — одним numpy-массивом на колонку, а не построчно.
+"""
+
+from src.products import Category, Product
+
+BASE_COLUMNS = ("name", "description", "price", "quantity")
+
+
+def _column_values(category, attributes):
+    products = list(category)
+    prices, quantities = category.columns()
+    names = [product.name for product in products]
+    descriptions = [product.description for product in products]
+    extra = {attribute: [getattr(product, attribute, None) for product in products] for attribute in attributes}
+    return names, descriptions, prices, quantities, extra
+
+
+def category_to_dataframe(category, attributes=()):
+    """DataFrame с колонками name, description, price, quantity и атрибутами attributes в порядке товаров."""
+    import numpy
+    import pandas
+
+    names, descriptions, prices, quantities, extra = _column_values(category, attributes)
+    data = {
+        "name": names,
+        "description": descriptions,
+        "price": numpy.frombuffer(prices, dtype=numpy.float64),
+        "quantity": numpy.frombuffer(quantities, dtype=numpy.int64 if quantities.typecode == "q" else numpy.float64),
+    }
+    data.update(extra)
+    return pandas.DataFrame(data, columns=list(BASE_COLUMNS) + list(attributes))
+
+
+def category_to_arrow(category, attributes=()):
+    """Таблица Arrow с теми же колонками; цены и остатки передаются без копирования."""
+    import pyarrow
+
+    names, descriptions, prices, quantities, extra = _column_values(category, attributes)
+    columns = {
+        "name": pyarrow.array(names, pyarrow.string()),
+        "description": pyarrow.array(descriptions, pyarrow.string()),
+        "price": pyarrow.Array.from_buffers(pyarrow.float64(), len(prices), [None, pyarrow.py_buffer(prices)]),
+        "quantity": pyarrow.Array.from_buffers(
+            pyarrow.int64() if quantities.typecode == "q" else pyarrow.float64(),
+            len(quantities),
+            [None, pyarrow.py_buffer(quantities)],
+        ),
+    }
+    for attribute, values in extra.items():
+        columns[attribute] = pyarrow.array(values)
+    return pyarrow.table(columns)
+
+
+def _build_category(name, description, columns, cls, columnar):
+    category = Category(name, description, [], columnar=columnar)
+    for row in zip(*columns):
+        category.add_product(cls(*row))
+    return category
+
+
+def category_from_dataframe(frame, name, description, cls=Product, attributes=(), columnar=False):
+    """Собирает категорию из DataFrame.
+
+    Колонки name, description, price, quantity и затем attributes передаются
+    в конструктор cls в этом порядке, например для Smartphone —
+    attributes=("efficiency", "model", "memory", "color"). Значения берутся
+    колонками через tolist(), поэтому получаются обычные числа и строки Python.
+    """
+    columns = [frame[column].tolist() for column in BASE_COLUMNS + tuple(attributes)]
+    return _build_category(name, description, columns, cls, columnar)
+
+
+def category_from_arrow(table, name, description, cls=Product, attributes=(), columnar=False):
+    """Собирает категорию из таблицы Arrow по тем же правилам, что и category_from_dataframe."""
+    columns = [table.column(column).to_pylist() for column in BASE_COLUMNS + tuple(attributes)]
+    return _build_category(name, description, columns, cls, columnar)
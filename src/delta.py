@@ -0,0 +1,124 @@
+from src.catalog import Catalog
+from src.products import Category, Product
+
+
+class DeltaReport:
+    """Итог применения ленты изменений: что добавлено, слито, удалено, переоценено и отклонено."""
+
+    def __init__(self):
+        self.added = []  # (категория, товар)
+        self.merged = []  # (категория, товар)
+        self.deleted = []  # (категория, товар)
+        self.repriced = []  # (категория, товар, старая цена, новая цена)
+        self.restocked = []  # (категория, товар, старое количество, новое количество)
+        self.created_categories = []
+        self.rejected = []  # (изменение, причина)
+
+    @property
+    def changed(self):
+        """Количество примененных изменений."""
+        return len(self.added) + len(self.merged) + len(self.deleted) + len(self.repriced) + len(self.restocked)
+
+    def __str__(self):
+        return (
+            f"Добавлено: {len(self.added)}, объединено: {len(self.merged)}, удалено: {len(self.deleted)}, "
+            f"переоценено: {len(self.repriced)}, изменен остаток: {len(self.restocked)}, "
+            f"отклонено: {len(self.rejected)}"
+        )
+
+
+def apply_delta(categories, changes):
+    """Применяет ленту изменений к живым категориям на месте и возвращает DeltaReport.
+
+    categories — Catalog, словарь имя -> Category или список категорий.
+    Каждое изменение — словарь с ключами "op" и "category":
+
+    * {"op": "upsert", "product": {"name", "description", "price", "quantity"}} — новый товар
+      или слияние с существующим по правилам Product.new_product;
+    * {"op": "delete", "name": ...};
+    * {"op": "price", "name": ..., "price": ...};
+    * {"op": "quantity", "name": ..., "quantity": ...}.
+
+    Изменения применяются в порядке ленты. Товары ищутся по имени за O(1),
+    удаление вхождения тоже стоит O(1), поэтому время зависит от размера ленты,
+    а не каталога.
+    """
+    if isinstance(categories, Catalog):
+        catalog = categories
+        lookup = catalog.get_category
+    else:
+        catalog = None
+        if not isinstance(categories, dict):
+            categories = {category.name: category for category in categories}
+        lookup = categories.get
+
+    report = DeltaReport()
+
+    for change in changes:
+        operation = change.get("op")
+        category_name = change.get("category")
+        category = lookup(category_name)
+
+        if operation == "upsert":
+            product_info = change.get("product") or {}
+            price, quantity = product_info.get("price"), product_info.get("quantity")
+            if price is None or quantity is None:
+                report.rejected.append((change, "Для товара нужно указать цену и количество"))
+                continue
+            if not isinstance(price, (int, float)) or price <= 0:
+                report.rejected.append((change, "Цена не должна быть нулевая или отрицательная"))
+                continue
+            if not isinstance(quantity, (int, float)) or quantity <= 0:
+                report.rejected.append((change, "Количество должно быть положительным"))
+                continue
+            if category is None:
+                category = Category(category_name, change.get("description", ""), [])
+                if catalog is not None:
+                    catalog.add_category(category)
+                else:
+                    categories[category_name] = category
+                report.created_categories.append(category)
+            existing = category.find_product(product_info.get("name"))
+            try:
+                product = Product.new_product(product_info, [existing] if existing is not None else [])
+            except (TypeError, ValueError) as error:
+                report.rejected.append((change, str(error)))
+                continue
+            if product is existing:
+                report.merged.append((category, product))
+            else:
+                category.add_product(product)
+                report.added.append((category, product))
+            continue
+
+        if category is None:
+            report.rejected.append((change, f"Категория {category_name} не найдена"))
+            continue
+        if operation not in ("delete", "price", "quantity"):
+            report.rejected.append((change, f"Неизвестная операция {operation}"))
+            continue
+        product = category.find_product(change.get("name"))
+        if product is None:
+            report.rejected.append((change, f"Товар {change.get('name')} не найден"))
+            continue
+
+        if operation == "delete":
+            category.remove_products([product])
+            report.deleted.append((category, product))
+        elif operation == "price":
+            price = change.get("price")
+            if not isinstance(price, (int, float)) or price <= 0:
+                report.rejected.append((change, "Цена не должна быть нулевая или отрицательная"))
+                continue
+            old_price = product.price
+            product.price = price
+            report.repriced.append((category, product, old_price, price))
+        else:
+            quantity = change.get("quantity")
+            if not isinstance(quantity, (int, float)) or quantity < 0:
+                report.rejected.append((change, "Количество не может быть отрицательным"))
+                continue
+            old_quantity = product.quantity
+            product.quantity = quantity
+            report.restocked.append((category, product, old_quantity, quantity))
+    return report
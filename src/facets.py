@@ -0,0 +1,151 @@
+from array import array
+
+from src.interning import intern_value
+from src.products import LawnGrass, Smartphone
+
+# Атрибуты, по которым строятся фасеты для каждого класса товаров
+FACET_ATTRIBUTES = {
+    Smartphone: ("memory", "color", "model", "efficiency"),
+    LawnGrass: ("country", "germination_period", "color"),
+}
+
+
+def facet_attributes(product):
+    for cls in type(product).__mro__:
+        if cls in FACET_ATTRIBUTES:
+            return FACET_ATTRIBUTES[cls]
+    return ()
+
+
+class FacetIndex:
+    """Битовые индексы по атрибутам товаров одной категории.
+
+    При добавлении товара его номер дописывается в список вхождений значения
+    (O(1)). Для запросов из списка лениво строится битовая маска — целое число
+    Python, в котором бит i установлен, если товар i имеет это значение. Маска
+    кэшируется до появления новых вхождений. Фильтры И/ИЛИ сводятся к операциям
+    & и | над масками, а количество товаров в фасете — к подсчету единичных битов.
+    Атрибуты индексируются в момент добавления товара в категорию.
+    """
+
+    def __init__(self, category, attributes=None):
+        self.__attributes = attributes
+        self.__products = []
+        self.__rows = {}  # id(product) -> номера строк товара
+        self.__removed = 0  # маска удаленных строк
+        self.__postings = {}  # атрибут -> {значение: array номеров товаров}
+        self.__bitmaps = {}  # (атрибут, значение) -> (маска, число вхождений в ней)
+        for product in category:
+            self.add(product)
+        category.subscribe(self._on_category_event)
+        category.register_index("facets", self)
+
+    def _on_category_event(self, category, event, product):
+        if event == "add":
+            self.add(product)
+        elif event == "remove":
+            self.remove(product)
+
+    def add(self, product):
+        row = len(self.__products)
+        self.__products.append(product)
+        self.__rows.setdefault(id(product), []).append(row)
+        attributes = self.__attributes if self.__attributes is not None else facet_attributes(product)
+        for attribute in attributes:
+            value = getattr(product, attribute, None)
+            if value is None:
+                continue
+            values = self.__postings.setdefault(attribute, {})
+            rows = values.get(value)
+            if rows is None:
+                rows = values[value] = array("q")
+            rows.append(row)
+
+    def remove(self, product):
+        """Убирает одно вхождение товара: строка помечается удаленной и исключается из выборок."""
+        rows = self.__rows.get(id(product))
+        if not rows:
+            return
+        self.__removed |= 1 << rows.pop()
+        if not rows:
+            del self.__rows[id(product)]
+
+    @property
+    def indexed_attributes(self):
+        """Атрибуты, по которым в индексе есть хотя бы одно значение."""
+        return frozenset(self.__postings)
+
+    def __mask(self, attribute, value):
+        rows = self.__postings.get(attribute, {}).get(value)
+        if rows is None:
+            return 0
+        cached = self.__bitmaps.get((attribute, value))
+        if cached is not None and cached[1] == len(rows):
+            return cached[0]
+        bits = bytearray((len(self.__products) + 7) // 8)
+        for row in rows:
+            bits[row >> 3] |= 1 << (row & 7)
+        mask = int.from_bytes(bits, "little")
+        self.__bitmaps[(attribute, value)] = (mask, len(rows))
+        return mask
+
+    def bitmap(self, **filters):
+        """Маска товаров, подходящих под все фильтры (И между атрибутами).
+
+        Значение фильтра может быть списком, кортежем или множеством — тогда
+        подходит любое из значений (ИЛИ внутри атрибута).
+        """
+        result = ((1 << len(self.__products)) - 1) & ~self.__removed
+        for attribute, value in filters.items():
+            result &= self.__match(attribute, value)
+            if not result:
+                break
+        return result
+
+    def any_bitmap(self, **filters):
+        """Маска товаров, подходящих хотя бы под один из фильтров (ИЛИ между атрибутами)."""
+        result = 0
+        for attribute, value in filters.items():
+            result |= self.__match(attribute, value)
+        return result & ~self.__removed
+
+    def __match(self, attribute, value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            result = 0
+            for item in value:
+                result |= self.__mask(attribute, intern_value(item))
+            return result
+        return self.__mask(attribute, intern_value(value))
+
+    def select(self, **filters):
+        """Товары, подходящие под все фильтры, в порядке добавления в категорию."""
+        return self.products(self.bitmap(**filters))
+
+    def select_any(self, **filters):
+        return self.products(self.any_bitmap(**filters))
+
+    def count(self, **filters):
+        return self.bitmap(**filters).bit_count()
+
+    def facet_counts(self, attribute, **filters):
+        """Количество товаров по каждому значению атрибута среди подходящих под фильтры."""
+        selected = self.bitmap(**filters)
+        counts = {}
+        for value in self.__postings.get(attribute, {}):
+            count = (self.__mask(attribute, value) & selected).bit_count()
+            if count:
+                counts[value] = count
+        return counts
+
+    def products(self, bitmap):
+        """Разворачивает маску в список товаров."""
+        bits = bin(bitmap)[:1:-1]  # младший бит первым
+        result = []
+        row = bits.find("1")
+        while row != -1:
+            result.append(self.__products[row])
+            row = bits.find("1", row + 1)
+        return result
+
+    def __len__(self):
+        return len(self.__products) - self.__removed.bit_count()
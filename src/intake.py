@@ -0,0 +1,121 @@
+import asyncio
+import time
+from collections import deque
+
+from src.orders import OrderEngine
+from src.products import Product
+
+
+class OrderIntake:
+    """Асинхронный прием заказов с группировкой в небольшие пачки.
+
+    Покупатель вызывает ``await intake.submit(product, quantity)`` и получает Order
+    (или исключение OutOfStockError). Рабочие корутины забирают заказы из очереди,
+    собирают пачку размером до max_batch_size или за время max_batch_latency,
+    группируют ее по товарам и проверяют остаток и цену один раз на товар.
+    """
+
+    def __init__(self, engine=None, max_batch_size=32, max_batch_latency=0.005, workers=4, max_queue_size=0):
+        if max_batch_size <= 0 or max_batch_latency < 0 or workers <= 0:
+            raise ValueError("Размер пачки и число обработчиков должны быть положительными, задержка неотрицательной")
+        self.engine = engine if engine is not None else OrderEngine()
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency = max_batch_latency
+        self.workers = workers
+        self.__max_queue_size = max_queue_size
+        self.__queue = None
+        self.__tasks = []
+        self.__batch_latencies = deque(maxlen=1000)
+        self.__batch_sizes = deque(maxlen=1000)
+        self.__batches = 0
+
+    async def start(self):
+        if self.__tasks:
+            return
+        self.__queue = asyncio.Queue(self.__max_queue_size)
+        self.__tasks = [asyncio.create_task(self.__worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Дожидается обработки уже принятых заказов и останавливает обработчики."""
+        if not self.__tasks:
+            return
+        await self.__queue.join()
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.stop()
+
+    async def submit(self, product, quantity):
+        """Ставит заказ в очередь и ждет его оформления."""
+        if not isinstance(product, Product):
+            raise TypeError(f"Ожидается объект типа Product, получен {type(product).__name__}.")
+        if not self.__tasks:
+            raise RuntimeError("Прием заказов не запущен, вызовите start()")
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((product, quantity, future, time.perf_counter()))
+        return await future
+
+    async def __worker(self):
+        queue = self.__queue
+        while True:
+            batch = [await queue.get()]
+            deadline = time.perf_counter() + self.max_batch_latency
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                self.__process(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def __process(self, batch):
+        groups = {}
+        for item in batch:
+            # Покупатель мог отменить ожидание, пока заказ стоял в очереди: такой заказ
+            # не оформляется, иначе остаток зарезервировался бы для никому не выданного заказа
+            if not item[2].done():
+                groups.setdefault(id(item[0]), []).append(item)
+        for items in groups.values():
+            product = items[0][0]
+            try:
+                results = self.engine.place_batch(product, [quantity for _, quantity, _, _ in items])
+            except Exception as error:  # Ошибка пачки достается всем ее заказам
+                results = [error] * len(items)
+            for (_, _, future, _), result in zip(items, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        self.__batches += 1
+        self.__batch_sizes.append(len(batch))
+        self.__batch_latencies.append(time.perf_counter() - min(item[3] for item in batch))
+
+    @property
+    def queue_depth(self):
+        return self.__queue.qsize() if self.__queue is not None else 0
+
+    def stats(self):
+        """Метрики для настройки: глубина очереди, размеры пачек и задержка от постановки до оформления."""
+        latencies = sorted(self.__batch_latencies)
+        sizes = self.__batch_sizes
+        return {
+            "queue_depth": self.queue_depth,
+            "batches": self.__batches,
+            "mean_batch_size": sum(sizes) / len(sizes) if sizes else 0.0,
+            "mean_batch_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_batch_latency": latencies[-1] if latencies else 0.0,
+            "p95_batch_latency": latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+        }
@@ -0,0 +1,17 @@
+"""Общие экземпляры для повторяющихся значений атрибутов товаров.
+
+Описания, цвета, страны и сроки прорастания у тысяч товаров совпадают, но из
+load_json каждое значение приходит отдельной строкой. intern_value заменяет
+строку общим интернированным экземпляром, поэтому одинаковые значения
+хранятся один раз, а их сравнение (== и поиск в словаре) сводится к проверке
+идентичности.
+"""
+
+import sys
+
+
+def intern_value(value):
+    """Возвращает общий экземпляр строки value; значения других типов возвращаются как есть."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
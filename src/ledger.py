@@ -0,0 +1,199 @@
+"""Журнал заказов только на дозапись с записями фиксированной длины.
+
+Формат (little-endian): заголовок — сигнатура, версия и длина записи; затем
+записи по 40 байт: время (float64, секунды Unix), идентификатор товара (uint64),
+количество (float64, может быть дробным; отрицательное — отмена), цена за единицу (float64) и сумма (float64).
+
+OrderLedger копит записи в буфере и дописывает их в файл пачкой (group commit):
+один вызов write и один fsync на batch_size записей. LedgerReader открывает
+файл через mmap и распаковывает записи по одной при переборе, поэтому для
+подсчета выручки и остатков журнал не загружается в память целиком.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from hashlib import blake2b
+
+MAGIC = b"OSLEDGER"
+VERSION = 2
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<dQddd")
+
+
+def product_id(product):
+    """Стабильный 64-битный идентификатор товара по имени (совпадает между запусками)."""
+    name = product if isinstance(product, str) else product.name
+    return int.from_bytes(blake2b(name.encode("UTF-8"), digest_size=8).digest(), "little")
+
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise ValueError(f"Файл {path} не является журналом заказов версии {VERSION}")
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"Файл {path} не является журналом заказов версии {VERSION}")
+
+
+class OrderLedger:
+    """Запись заказов в журнал пачками."""
+
+    def __init__(self, path, batch_size=1024, durable=True, clock=time.time):
+        if batch_size <= 0:
+            raise ValueError("Размер пачки должен быть положительным")
+        self.path = path
+        self.batch_size = batch_size
+        self.durable = durable
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__buffer = bytearray()
+        self.__pending = 0
+        # Заголовок проверяется до открытия на дозапись, чтобы не оставлять открытый файл при ошибке
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as file:
+                _check_header(file.read(HEADER.size), path)
+        self.__file = open(path, "ab")
+        try:
+            size = self.__file.tell()
+            if size == 0:
+                self.__file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+                self.__file.flush()
+            else:
+                # Хвост недописанной записи (например, после сбоя) отбрасывается
+                tail = (size - HEADER.size) % RECORD.size
+                if tail:
+                    self.__file.truncate(size - tail)
+                    self.__file.seek(0, os.SEEK_END)
+        except BaseException:
+            self.__file.close()
+            raise
+
+    def record(self, product, quantity, total, timestamp=None):
+        """Добавляет запись; в файл она попадет с заполнением пачки или при flush()."""
+        unit_price = total / quantity if quantity else 0.0
+        with self.__lock:
+            if timestamp is None:
+                timestamp = self.__clock()
+            self.__buffer += RECORD.pack(timestamp, product_id(product), quantity, unit_price, total)
+            self.__pending += 1
+            if self.__pending >= self.batch_size:
+                self.__commit()
+
+    def append(self, order, timestamp=None):
+        self.record(order.product, order.quantity, order.total_cost, timestamp)
+
+    def append_cancel(self, order, timestamp=None):
+        """Отмена заказа: запись с отрицательными количеством и суммой."""
+        self.record(order.product, -order.quantity, -order.total_cost, timestamp)
+
+    def __commit(self):
+        if not self.__buffer:
+            return
+        self.__file.write(self.__buffer)
+        self.__file.flush()
+        if self.durable:
+            os.fsync(self.__file.fileno())
+        self.__buffer = bytearray()
+        self.__pending = 0
+
+    def flush(self):
+        """Дописывает накопленную пачку в файл."""
+        with self.__lock:
+            self.__commit()
+
+    @property
+    def pending(self):
+        """Число записей, еще не записанных в файл."""
+        return self.__pending
+
+    def close(self):
+        with self.__lock:
+            if self.__file.closed:
+                return
+            self.__commit()
+            self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class LedgerReader:
+    """Журнал заказов, открытый через mmap только для чтения.
+
+    Видны записи, дописанные в файл к моменту открытия.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            _check_header(file.read(HEADER.size), path)
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__count = (size - HEADER.size) // RECORD.size
+        self.__view = memoryview(self.__mmap)[HEADER.size:HEADER.size + self.__count * RECORD.size]
+
+    def __len__(self):
+        return self.__count
+
+    def __iter__(self):
+        """Записи (время, идентификатор товара, количество, цена за единицу, сумма) в порядке записи."""
+        return RECORD.iter_unpack(self.__view)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("Номер записи вне журнала")
+        return RECORD.unpack_from(self.__view, index * RECORD.size)
+
+    def revenue(self, start=None, end=None):
+        """Выручка с учетом отмен за полуинтервал времени [start, end)."""
+        total = 0.0
+        for timestamp, _, _, _, amount in RECORD.iter_unpack(self.__view):
+            if (start is None or timestamp >= start) and (end is None or timestamp < end):
+                total += amount
+        return total
+
+    def totals_by_product(self, start=None, end=None):
+        """Идентификатор товара -> [продано штук, выручка] за полуинтервал [start, end)."""
+        totals = {}
+        for timestamp, identifier, quantity, _, amount in RECORD.iter_unpack(self.__view):
+            if (start is None or timestamp >= start) and (end is None or timestamp < end):
+                entry = totals.get(identifier)
+                if entry is None:
+                    totals[identifier] = [quantity, amount]
+                else:
+                    entry[0] += quantity
+                    entry[1] += amount
+        return totals
+
+    def replay(self, products):
+        """Восстанавливает остатки: вычитает проданное по журналу из количества товаров.
+
+        products — остатки до первой записи журнала (например, из снимка каталога).
+        Возвращает словарь товар -> списанное количество.
+        """
+        by_id = {product_id(product): product for product in products}
+        sold = {}
+        for identifier, (quantity, _) in self.totals_by_product().items():
+            product = by_id.get(identifier)
+            if product is not None and quantity:
+                if quantity.is_integer():  # Целые остатки не превращаются в дробные
+                    quantity = int(quantity)
+                product.quantity -= quantity
+                sold[product] = quantity
+        return sold
+
+    def close(self):
+        self.__view.release()
+        self.__mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
@@ -0,0 +1,194 @@
+"""Необязательная инструментация горячих путей магазина.
+
+enable_metrics() подменяет Category.add_product, Product.new_product, конструктор
+Product, сеттер Product.price, Order.__init__ и загрузчики src.utils (load_json,
+iter_categories, load_categories, load_shards) обертками, которые считают вызовы,
+время и отказы. Установка цены внутри конструктора считается как создание товара,
+а не как вызов сеттера. Загрузчики подменяются атрибутами модуля src.utils, поэтому
+учитываются вызовы вида utils.load_json(...), а не ранее импортированные имена.
+disable_metrics() возвращает исходные функции, поэтому в выключенном состоянии
+инструментация ничего не стоит. metrics_snapshot() можно вызывать из любого потока.
+"""
+
+import threading
+import time
+from collections import deque
+
+from src.products import Category, Order, Product
+
+SAMPLE_SIZE = 10_000  # сколько последних замеров хранить для перцентилей
+
+_lock = threading.Lock()
+_stats = {}
+_originals = []
+_constructing = threading.local()  # глубина вложенных конструкторов Product в текущем потоке
+
+
+class _Stat:
+    def __init__(self):
+        self.calls = 0
+        self.rejections = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+
+def _record(name, seconds, rejected=False):
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.calls += 1
+        stat.total_seconds += seconds
+        stat.samples.append(seconds)
+        if seconds > stat.max_seconds:
+            stat.max_seconds = seconds
+        if rejected:
+            stat.rejections += 1
+
+
+def _timed(name, function, rejected_errors=()):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except rejected_errors:
+            _record(name, time.perf_counter() - started, rejected=True)
+            raise
+        except BaseException:
+            _record(name, time.perf_counter() - started)
+            raise
+        _record(name, time.perf_counter() - started)
+        return result
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = getattr(function, "__name__", name)
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _timed_iterator(name, function, rejected_errors=()):
+    """Обертка генератора: учитывается время внутри генератора за весь перебор, без времени потребителя."""
+
+    def wrapper(*args, **kwargs):
+        iterator = function(*args, **kwargs)
+        elapsed = 0.0
+        rejected = False
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                except rejected_errors:
+                    rejected = True
+                    raise
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield item
+        finally:
+            iterator.close()
+            _record(name, elapsed, rejected)
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _timed_constructor(init):
+    timed = _timed("Product", init, (TypeError, ValueError))
+
+    def wrapper(product, *args, **kwargs):
+        _constructing.depth = getattr(_constructing, "depth", 0) + 1
+        try:
+            timed(product, *args, **kwargs)
+        finally:
+            _constructing.depth -= 1
+
+    wrapper.__wrapped__ = init
+    return wrapper
+
+
+def _timed_price_setter(setter):
+    def wrapper(product, value):
+        if getattr(_constructing, "depth", 0):
+            setter(product, value)
+            return
+        started = time.perf_counter()
+        setter(product, value)
+        _record("Product.price", time.perf_counter() - started, rejected=value <= 0)
+
+    return wrapper
+
+
+def _replace(owner, attribute, value):
+    _originals.append((owner, attribute, owner.__dict__[attribute]))
+    setattr(owner, attribute, value)
+
+
+def metrics_enabled():
+    return bool(_originals)
+
+
+def enable_metrics():
+    """Включает сбор метрик (повторный вызов ничего не меняет)."""
+    from src import utils
+
+    with _lock:
+        if _originals:
+            return
+        _replace(Category, "add_product", _timed("Category.add_product", Category.add_product, TypeError))
+        new_product = _timed("Product.new_product", Product.__dict__["new_product"].__func__, (TypeError, ValueError))
+        _replace(Product, "new_product", classmethod(new_product))
+        _replace(Product, "__init__", _timed_constructor(Product.__init__))
+        price = Product.__dict__["price"]
+        _replace(Product, "price", property(price.fget, _timed_price_setter(price.fset), price.fdel, price.__doc__))
+        _replace(Order, "__init__", _timed("Order", Order.__init__, TypeError))
+        load_errors = (OSError, ValueError)
+        _replace(utils, "load_json", _timed("load_json", utils.load_json, load_errors))
+        _replace(utils, "iter_categories", _timed_iterator("iter_categories", utils.iter_categories, load_errors))
+        _replace(utils, "load_categories", _timed("load_categories", utils.load_categories, load_errors))
+        _replace(utils, "load_shards", _timed("load_shards", utils.load_shards, load_errors))
+
+
+def disable_metrics():
+    """Возвращает исходные функции; накопленные метрики сохраняются до reset_metrics()."""
+    with _lock:
+        while _originals:
+            owner, attribute, value = _originals.pop()
+            setattr(owner, attribute, value)
+
+
+def reset_metrics():
+    with _lock:
+        _stats.clear()
+
+
+def _percentile(samples, fraction):
+    return samples[min(int(fraction * len(samples)), len(samples) - 1)]
+
+
+def metrics_snapshot():
+    """Копия метрик: вызовы, отказы, суммарное и среднее время, перцентили задержки в секундах."""
+    with _lock:
+        stats = {
+            name: (stat.calls, stat.rejections, stat.total_seconds, stat.max_seconds, list(stat.samples))
+            for name, stat in _stats.items()
+        }
+
+    snapshot = {}
+    for name, (calls, rejections, total_seconds, max_seconds, samples) in stats.items():
+        samples.sort()
+        snapshot[name] = {
+            "calls": calls,
+            "rejections": rejections,
+            "total_seconds": total_seconds,
+            "mean_seconds": total_seconds / calls,
+            "p50_seconds": _percentile(samples, 0.50),
+            "p95_seconds": _percentile(samples, 0.95),
+            "p99_seconds": _percentile(samples, 0.99),
+            "max_seconds": max_seconds,
+        }
+    return snapshot
@@ -0,0 +1,129 @@
+import threading
+
+from src.products import Order, Product
+
+
+class OutOfStockError(ValueError):
+    """Заказ отклонен: на складе недостаточно товара."""
+
+
+class OrderEngine:
+    """Оформляет заказы с атомарным резервированием остатка.
+
+    Вместо одной общей блокировки используется набор блокировок (lock striping):
+    товар всегда попадает в одну и ту же полосу, поэтому заказы разных товаров
+    оформляются параллельно, а заказы одного товара не могут продать больше остатка.
+    Если передан журнал ledger (OrderLedger), принятые заказы и отмены записываются в него.
+    Если заказ не удалось записать в журнал, резерв возвращается на склад и заказ отклоняется.
+    """
+
+    def __init__(self, stripes=64, ledger=None):
+        if stripes <= 0:
+            raise ValueError("Количество блокировок должно быть положительным")
+        self.ledger = ledger
+        self.__locks = [threading.Lock() for _ in range(stripes)]
+        self.__stats_lock = threading.Lock()
+        self.__placed = 0
+        self.__rejected = 0
+
+    def lock_for(self, product):
+        # Адреса объектов выровнены по 16 байт, младшие биты не несут информации
+        return self.__locks[(id(product) >> 4) % len(self.__locks)]
+
+    def place(self, product, quantity):
+        """Резервирует quantity единиц товара и возвращает Order или бросает OutOfStockError."""
+        if not isinstance(product, Product):
+            raise TypeError(f"Ожидается объект типа Product, получен {type(product).__name__}.")
+        if quantity <= 0:
+            raise ValueError("Количество в заказе должно быть положительным")
+
+        with self.lock_for(product):
+            available = product.quantity
+            if available < quantity:
+                order = None
+            else:
+                product.quantity = available - quantity
+                order = Order(product, quantity)
+
+        if order is not None and self.ledger is not None:
+            try:
+                self.ledger.append(order)
+            except Exception:
+                self.__release(order)
+                with self.__stats_lock:
+                    self.__rejected += 1
+                raise
+
+        with self.__stats_lock:
+            if order is None:
+                self.__rejected += 1
+            else:
+                self.__placed += 1
+        if order is None:
+            raise OutOfStockError(
+                f"Недостаточно товара {product.name}: запрошено {quantity}, в наличии {available}"
+            )
+        return order
+
+    def place_batch(self, product, quantities):
+        """Резервирует пачку заказов одного товара за одну проверку остатка и цены.
+
+        Заказы удовлетворяются в порядке следования, пока хватает товара. Возвращает
+        список той же длины: Order для принятых и исключение (OutOfStockError,
+        ValueError или ошибку записи в журнал) для отклоненных.
+        """
+        if not isinstance(product, Product):
+            raise TypeError(f"Ожидается объект типа Product, получен {type(product).__name__}.")
+
+        results = []
+        with self.lock_for(product):
+            available = product.quantity
+            reserved = 0
+            for quantity in quantities:
+                if quantity <= 0:
+                    results.append(ValueError("Количество в заказе должно быть положительным"))
+                elif reserved + quantity > available:
+                    results.append(
+                        OutOfStockError(
+                            f"Недостаточно товара {product.name}: запрошено {quantity}, "
+                            f"в наличии {available - reserved}"
+                        )
+                    )
+                else:
+                    reserved += quantity
+                    results.append(Order(product, quantity))
+            if reserved:
+                product.quantity = available - reserved
+
+        if self.ledger is not None:
+            for index, result in enumerate(results):
+                if isinstance(result, Order):
+                    try:
+                        self.ledger.append(result)
+                    except Exception as error:
+                        self.__release(result)
+                        results[index] = error
+        placed = sum(isinstance(result, Order) for result in results)
+        with self.__stats_lock:
+            self.__placed += placed
+            self.__rejected += len(results) - placed
+        return results
+
+    def __release(self, order):
+        """Возвращает резерв заказа, который не удалось записать в журнал."""
+        with self.lock_for(order.product):
+            order.product.quantity += order.quantity
+
+    def cancel(self, order):
+        """Возвращает зарезервированный заказом товар на склад."""
+        self.__release(order)
+        if self.ledger is not None:
+            self.ledger.append_cancel(order)
+
+    @property
+    def placed_count(self):
+        return self.__placed
+
+    @property
+    def rejected_count(self):
+        return self.__rejected
@@ -0,0 +1,194 @@
+from bisect import bisect_left, bisect_right
+
+
+# Целевой размер блока: вставка и удаление сдвигают не больше 2 * BLOCK_SIZE элементов
+BLOCK_SIZE = 512
+
+
+class PriceIndex:
+    """Отсортированный по цене индекс товаров из одной или нескольких категорий.
+
+    Индекс подписывается на категории (добавление товаров) и на сами товары
+    (изменение цены через сеттер Product.price), поэтому всегда актуален.
+    Ключи (цена, порядковый номер) хранятся в отсортированных блоках ограниченного
+    размера, а для каждого блока запоминается его наибольший ключ. Поиск — два
+    двоичных поиска, вставка и удаление сдвигают элементы только внутри одного
+    блока, поэтому изменение цены не зависит линейно от размера индекса.
+    watch() строит индекс по всей категории одной сортировкой.
+    """
+
+    def __init__(self, categories=()):
+        self.__blocks = []  # блоки ключей (цена, порядковый номер) по возрастанию
+        self.__product_blocks = []  # товары в тех же блоках и в том же порядке
+        self.__maxes = []  # наибольший ключ каждого блока
+        self.__size = 0
+        self.__entries = {}  # id(product) -> [ключ, число вхождений]
+        self.__sequence = 0
+        for category in categories:
+            self.watch(category)
+
+    def watch(self, category):
+        """Индексирует товары категории и следит за новыми."""
+        added = []
+        for product in category:
+            entry = self.__entries.get(id(product))
+            if entry is not None:
+                entry[1] += 1
+                continue
+            key = (product.price, self.__sequence)
+            self.__sequence += 1
+            self.__entries[id(product)] = [key, 1]
+            added.append((key, product))
+            product.subscribe(self._on_product_change)
+        if added:
+            # Ключи уникальны, поэтому сортировка не сравнивает сами товары
+            pairs = [pair for block in zip(self.__blocks, self.__product_blocks) for pair in zip(*block)]
+            self.__build(sorted(pairs + added))
+        category.subscribe(self._on_category_event)
+        category.register_index("price", self)
+
+    def __build(self, pairs):
+        self.__blocks = []
+        self.__product_blocks = []
+        for start in range(0, len(pairs), BLOCK_SIZE):
+            chunk = pairs[start:start + BLOCK_SIZE]
+            self.__blocks.append([key for key, _ in chunk])
+            self.__product_blocks.append([product for _, product in chunk])
+        self.__maxes = [keys[-1] for keys in self.__blocks]
+        self.__size = len(pairs)
+
+    def add(self, product):
+        entry = self.__entries.get(id(product))
+        if entry is not None:
+            entry[1] += 1
+            return
+        key = (product.price, self.__sequence)
+        self.__sequence += 1
+        self.__entries[id(product)] = [key, 1]
+        self.__insert(key, product)
+        product.subscribe(self._on_product_change)
+
+    def remove(self, product):
+        """Убирает одно вхождение товара; товар исчезает из индекса вместе с последним."""
+        entry = self.__entries.get(id(product))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self.__entries[id(product)]
+            self.__delete(entry[0])
+            product.unsubscribe(self._on_product_change)
+
+    def _on_category_event(self, category, event, product):
+        if event == "add":
+            self.add(product)
+        elif event == "remove":
+            self.remove(product)
+
+    def _on_product_change(self, product, field, old_value, new_value):
+        if field != "price":
+            return
+        entry = self.__entries[id(product)]
+        self.__delete(entry[0])
+        entry[0] = (new_value, entry[0][1])
+        self.__insert(entry[0], product)
+
+    def __insert(self, key, product):
+        if not self.__blocks:
+            self.__blocks.append([key])
+            self.__product_blocks.append([product])
+            self.__maxes.append(key)
+            self.__size = 1
+            return
+        block = min(bisect_left(self.__maxes, key), len(self.__maxes) - 1)
+        keys = self.__blocks[block]
+        products = self.__product_blocks[block]
+        position = bisect_left(keys, key)
+        keys.insert(position, key)
+        products.insert(position, product)
+        self.__maxes[block] = keys[-1]
+        self.__size += 1
+        if len(keys) > 2 * BLOCK_SIZE:
+            # Переполненный блок делится пополам
+            self.__blocks[block + 1:block + 1] = [keys[BLOCK_SIZE:]]
+            self.__product_blocks[block + 1:block + 1] = [products[BLOCK_SIZE:]]
+            del keys[BLOCK_SIZE:]
+            del products[BLOCK_SIZE:]
+            self.__maxes[block:block + 1] = [keys[-1], self.__blocks[block + 1][-1]]
+
+    def __delete(self, key):
+        block = bisect_left(self.__maxes, key)
+        keys = self.__blocks[block]
+        position = bisect_left(keys, key)
+        del keys[position]
+        del self.__product_blocks[block][position]
+        self.__size -= 1
+        if keys:
+            self.__maxes[block] = keys[-1]
+        else:
+            del self.__blocks[block]
+            del self.__product_blocks[block]
+            del self.__maxes[block]
+
+    def __locate(self, key):
+        """Блок и позиция первого ключа, не меньшего key (блок равен числу блоков, если такого нет)."""
+        block = bisect_left(self.__maxes, key)
+        if block == len(self.__maxes):
+            return block, 0
+        return block, bisect_left(self.__blocks[block], key)
+
+    def between(self, low, high):
+        """Товары с ценой в диапазоне [low, high] по возрастанию цены."""
+        block, position = self.__locate((low,))
+        stop_key = (high, float("inf"))
+        result = []
+        while block < len(self.__blocks):
+            keys = self.__blocks[block]
+            if keys[-1] <= stop_key:
+                result.extend(self.__product_blocks[block][position:])
+            else:
+                result.extend(self.__product_blocks[block][position:bisect_right(keys, stop_key)])
+                break
+            block, position = block + 1, 0
+        return result
+
+    def cheapest(self, k):
+        """k самых дешевых товаров."""
+        result = []
+        for products in self.__product_blocks:
+            if len(result) >= k:
+                break
+            result.extend(products[:k - len(result)])
+        return result
+
+    def most_expensive(self, k):
+        """k самых дорогих товаров, начиная с самого дорогого."""
+        result = []
+        for products in reversed(self.__product_blocks):
+            if len(result) >= k:
+                break
+            result.extend(products[::-1][:k - len(result)])
+        return result
+
+    def nearest(self, price):
+        """Товар с ценой, ближайшей к price (при равенстве — более дешевый), или None."""
+        if not self.__size:
+            return None
+        block, position = self.__locate((price,))
+        if block == len(self.__blocks):
+            return self.__product_blocks[-1][-1]
+        after_key, after = self.__blocks[block][position], self.__product_blocks[block][position]
+        if position:
+            before_key, before = self.__blocks[block][position - 1], self.__product_blocks[block][position - 1]
+        elif block:
+            before_key, before = self.__blocks[block - 1][-1], self.__product_blocks[block - 1][-1]
+        else:
+            return after
+        return before if price - before_key[0] <= after_key[0] - price else after
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        """Перебирает товары по возрастанию цены."""
+        return iter([product for products in self.__product_blocks for product in products])
@@ -1,11 +1,19 @@
+import operator
+import threading
 from abc import ABC, abstractmethod
+from array import array
+
+from src.interning import intern_value
 
 
 class BaseProduct(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, name, description, price, quantity):
         self.name = name
-        self.description = description
+        # Описания часто повторяются: одинаковые строки хранятся в одном экземпляре
+        self.description = intern_value(description)
         self.price = price
         self.quantity = quantity
 
@@ -15,18 +23,32 @@ class BaseProduct(ABC):
 
 
 class CreationInfoMixin:
+    __slots__ = ()
+
+    # Трассировщик создания объектов; None — трассировка выключена и ничего не стоит
+    creation_tracer = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        print(
-            f"Создан объект класса {self.__class__.__name__} с параметрами: {args}, {kwargs}"
-        )
+        tracer = self.creation_tracer
+        if tracer is not None:
+            tracer(self.__class__, args, kwargs)
+
+    @classmethod
+    def set_creation_tracer(cls, tracer):
+        """Включает трассировку для класса и его наследников (None — выключает)."""
+        cls.creation_tracer = tracer
 
 
 class Product(CreationInfoMixin, BaseProduct):
+    # Слоты вместо __dict__: миллионы товаров в памяти занимают заметно меньше места
+    __slots__ = ("name", "description", "__quantity", "__price", "__listeners")
+
     def __init__(self, name, description, price, quantity):
         # Добавляем проверку на нулевое количество
         if quantity <= 0:
             raise ValueError("Товар с нулевым количеством не может быть добавлен")
+        self.__listeners = None
         super().__init__(name, description, price, quantity)
         self.price = price  # Используем сеттер для установки начальной цены
         # self.quantity = quantity
@@ -41,9 +63,58 @@ class Product(CreationInfoMixin, BaseProduct):
         """Сеттер для установки цены товара с проверкой."""
         if value <= 0:
             print("Цена не должна быть нулевая или отрицательная")
+        elif self.__listeners:
+            old_value = self.__price
+            self.__price = value
+            self._notify("price", old_value, value)
         else:
             self.__price = value  # Установка новой цены, если она положительная
 
+    @property
+    def quantity(self):
+        """Геттер для получения количества товара."""
+        return self.__quantity
+
+    @quantity.setter
+    def quantity(self, value):
+        """Сеттер количества; подписчики узнают об изменении остатка."""
+        if self.__listeners:
+            old_value = self.__quantity
+            self.__quantity = value
+            self._notify("quantity", old_value, value)
+        else:
+            self.__quantity = value
+
+    @classmethod
+    def restore(cls, name, description, price, quantity, **attributes):
+        """Восстанавливает сохраненный товар без проверок и трассировки создания.
+
+        Используется при загрузке снимков каталога: остаток проданного товара может быть нулевым.
+        """
+        product = cls.__new__(cls)
+        product.__listeners = None
+        product.name = name
+        product.description = intern_value(description)
+        product.__price = price
+        product.__quantity = quantity
+        for attribute, value in attributes.items():
+            setattr(product, attribute, intern_value(value))
+        return product
+
+    def subscribe(self, listener):
+        """Подписывает listener(product, field, old, new) на изменения цены и количества."""
+        if self.__listeners is None:
+            self.__listeners = []
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if self.__listeners and listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def _notify(self, field, old_value, new_value):
+        for listener in tuple(self.__listeners):
+            listener(self, field, old_value, new_value)
+
     def __str__(self):
         return f"Продукт: {self.name}, Описание: {self.description}, Цена: {self.price}, Количество: {self.quantity}"
 
@@ -57,50 +128,121 @@ class Product(CreationInfoMixin, BaseProduct):
         product_price = product_info.get("price")
         product_quantity = product_info.get("quantity")
 
+        # Индекс по имени: поиск за O(1) вместо перебора списка
+        if isinstance(existing_products, ProductIndex):
+            existing_product = existing_products.get(product_name)
+            if existing_product is not None:
+                existing_product.merge(product_price, product_quantity)
+                return existing_product
+            product = cls(product_name, product_description, product_price, product_quantity)
+            existing_products.add(product)
+            return product
+
         for existing_product in existing_products:
             if existing_product.name == product_name:
-                existing_product.quantity += product_quantity
-                existing_product.price = max(existing_product.price, product_price)
+                existing_product.merge(product_price, product_quantity)
                 return existing_product
 
         return cls(product_name, product_description, product_price, product_quantity)
 
+    @classmethod
+    def new_products(cls, products_info, existing_products=None):
+        """Сливает пачку словарей с товарами за один проход и возвращает индекс."""
+        if isinstance(existing_products, ProductIndex):
+            index = existing_products
+        else:
+            index = ProductIndex(existing_products or [])
+        for product_info in products_info:
+            cls.new_product(product_info, index)
+        return index
+
+    def merge(self, price, quantity):
+        """Объединяет дубликат: количество складывается, цена берется максимальная."""
+        self.quantity += quantity
+        self.price = max(self.price, price)
+
     def __str__(self):
         """Возвращает строковое представление продукта."""
         return f"{self.name}, {self.price} руб. Остаток: {self.quantity} шт."
 
     def __add__(self, other):
-        """Возвращает общую стоимость двух продуктов."""
-        if type(other) is Product:
+        """Возвращает общую стоимость двух продуктов одного класса."""
+        if type(other) is type(self):
             total_value_self = self.price * self.quantity
             total_value_other = other.price * other.quantity
             return total_value_self + total_value_other
         return NotImplemented  # Возвращаем NotImplemented, если операция невозможна
 
 
+class ProductIndex:
+    """Реестр товаров с доступом по имени за O(1)."""
+
+    def __init__(self, products=()):
+        self.__products = {}
+        for product in products:
+            self.add(product)
+
+    def add(self, product):
+        if not isinstance(product, Product):
+            raise TypeError(
+                f"Невозможно добавить объект типа {type(product).__name__}. Ожидается Product или его наследник."
+            )
+        # Как и при переборе списка, при совпадении имен побеждает первый товар
+        return self.__products.setdefault(product.name, product)
+
+    def remove(self, product):
+        """Удаляет товар из реестра, если под его именем зарегистрирован именно он."""
+        if self.__products.get(product.name) is product:
+            del self.__products[product.name]
+            return True
+        return False
+
+    def get(self, name, default=None):
+        return self.__products.get(name, default)
+
+    def __getitem__(self, name):
+        return self.__products[name]
+
+    def __contains__(self, name):
+        return name in self.__products
+
+    def __len__(self):
+        return len(self.__products)
+
+    def __iter__(self):
+        """Перебирает товары в порядке добавления."""
+        return iter(self.__products.values())
+
+
 class Smartphone(Product):
+    __slots__ = ("efficiency", "model", "memory", "color")
+
     def __init__(
         self, name, description, price, quantity, efficiency, model, memory, color
     ):
         super().__init__(name, description, price, quantity)
         self.efficiency = efficiency
-        self.model = model
+        self.model = intern_value(model)
         self.memory = memory
-        self.color = color
+        self.color = intern_value(color)
 
     def __str__(self):
         return f"{super().__str__()}, Процессор: {self.processor}, Модель: {self.model}, Память: {self.memory}GB, Цвет: {self.color}"
 
 
 class LawnGrass(Product):
+    __slots__ = ("country", "germination_period", "color")
+
+    # Длина пока не задается, поэтому хранится на уровне класса, а не в каждом объекте
+    length = None
+
     def __init__(
         self, name, description, price, quantity, country, germination_period, color
     ):
         super().__init__(name, description, price, quantity)
-        self.length = None
-        self.country = country
-        self.germination_period = germination_period
-        self.color = color
+        self.country = intern_value(country)
+        self.germination_period = intern_value(germination_period)
+        self.color = intern_value(color)
 
     def __str__(self):
         return f"{super().__str__()}, Страна: {self.country}, Длина: {self.length} см, Цвет: {self.color}"
@@ -130,44 +272,316 @@ class Category(BaseEntity):
     category_count = 0
     product_count = 0
 
-    def __init__(self, name, description, l):
+    def __init__(self, name, description, l, columnar=False):
         self.l = l
         self.name = name
         self.description = description
         self.__products = []  # Приватный атрибут для хранения списка продуктов
+        self.__rows = {}  # id(product) -> номера строк товара в списке (и в колонках)
+        self.__names = {}  # имя -> товары с этим именем в порядке добавления
+        # id(product) -> [цена, остаток], по которым товар сейчас учтен в итогах и колонках
+        self.__values = {}
+        # Колоночный режим: цены и остатки дублируются в непрерывных массивах.
+        # Остатки хранятся как int64, пока не появится дробное количество (тогда float64)
+        self.__prices = array("d") if columnar else None
+        self.__quantities = array("q") if columnar else None
+        # Накопленные итоги обновляются при каждом изменении, поэтому агрегаты считаются за O(1)
+        self.__price_sum = 0
+        self.__quantity_sum = 0
+        self.__stock_value = 0
+        self.__rendered = None  # Кэш строки products, сбрасывается при изменениях
+        self.__listeners = []
+        self.__indexes = {}  # вид индекса -> индекс, который следит за категорией
+        self.__lock = threading.Lock()  # Защищает итоги при изменении остатков из нескольких потоков
         Category.category_count += 1
 
+    @property
+    def columnar(self):
+        return self.__prices is not None
+
     def add_product(self, product):
         if isinstance(product, Product):
-            self.__products.append(product)
+            with self.__lock:
+                if self.columnar:
+                    # До любых изменений: иначе ошибка array оставила бы категорию в несогласованном виде
+                    self.__widen_quantities(product.quantity)
+                rows = self.__rows.get(id(product))
+                if rows is None:
+                    rows = self.__rows[id(product)] = []
+                    self.__values[id(product)] = [product.price, product.quantity]
+                    product.subscribe(self._on_product_change)
+                    self.__names.setdefault(product.name, []).append(product)
+                # Новое вхождение учитывается по тем же значениям, что и прежние; еще не
+                # обработанное уведомление об изменении товара затем поправит все вхождения сразу
+                price, quantity = self.__values[id(product)]
+                rows.append(len(self.__products))
+                self.__products.append(product)
+                if self.columnar:
+                    self.__prices.append(price)
+                    self.__quantities.append(quantity)
+                self.__price_sum += price
+                self.__quantity_sum += quantity
+                self.__stock_value += price * quantity
+                self.__rendered = None
             Category.product_count += 1
+            for listener in tuple(self.__listeners):
+                listener(self, "add", product)
         else:
             raise TypeError(
                 f"Невозможно добавить объект типа {type(product).__name__}. Ожидается Product или его наследник."
             )
 
+    def add_products(self, products):
+        """Добавляет пачку товаров: одна блокировка и одно обновление итогов и колонок на всю пачку.
+
+        Пачка проверяется до изменений; подписчики получают событие "add" на каждый товар, как при add_product.
+        """
+        products = list(products)
+        for product in products:
+            if not isinstance(product, Product):
+                raise TypeError(
+                    f"Невозможно добавить объект типа {type(product).__name__}. Ожидается Product или его наследник."
+                )
+        if not products:
+            return
+        with self.__lock:
+            if self.columnar:
+                for product in products:
+                    self.__widen_quantities(product.quantity)
+            rows_by_id = self.__rows
+            values_by_id = self.__values
+            names = self.__names
+            on_change = self._on_product_change
+            price_sum = quantity_sum = stock_value = 0
+            values = []
+            for row, product in enumerate(products, len(self.__products)):
+                rows = rows_by_id.get(id(product))
+                if rows is None:
+                    rows_by_id[id(product)] = [row]
+                    value = values_by_id[id(product)] = [product.price, product.quantity]
+                    product.subscribe(on_change)
+                    names.setdefault(product.name, []).append(product)
+                else:
+                    rows.append(row)
+                    value = values_by_id[id(product)]
+                values.append(value)
+                price, quantity = value
+                price_sum += price
+                quantity_sum += quantity
+                stock_value += price * quantity
+            self.__products.extend(products)
+            if self.columnar:
+                self.__prices.extend([price for price, _ in values])
+                self.__quantities.extend([quantity for _, quantity in values])
+            self.__price_sum += price_sum
+            self.__quantity_sum += quantity_sum
+            self.__stock_value += stock_value
+            self.__rendered = None
+        Category.product_count += len(products)
+        listeners = tuple(self.__listeners)
+        if listeners:
+            for product in products:
+                for listener in listeners:
+                    listener(self, "add", product)
+
+    def __contains__(self, product):
+        """Проверяет за O(1), есть ли товар в категории."""
+        return id(product) in self.__rows
+
+    def __len__(self):
+        return len(self.__products)
+
+    def register_index(self, kind, index):
+        """Запоминает индекс ("price", "search", "facets"), чтобы запросы могли им воспользоваться."""
+        self.__indexes[kind] = index
+
+    def get_index(self, kind):
+        return self.__indexes.get(kind)
+
+    def query(self):
+        """Ленивый запрос к товарам категории: category.query().where(...).order_by("price").limit(20)."""
+        from src.query import Query
+
+        return Query(self)
+
+    def columns(self):
+        """Цены и остатки товаров в порядке перебора категории: копии колонок array("d") и array("q")."""
+        with self.__lock:
+            if self.columnar:
+                return array("d", self.__prices), array(self.__quantities.typecode, self.__quantities)
+            products = list(self.__products)
+        quantities = [product.quantity for product in products]
+        typecode = "q" if all(type(quantity) is int for quantity in quantities) else "d"
+        return array("d", (product.price for product in products)), array(typecode, quantities)
+
+    def find_product(self, name, default=None):
+        """Возвращает товар категории по имени за O(1)."""
+        products = self.__names.get(name)
+        return products[0] if products else default
+
+    def remove_products(self, products):
+        """Удаляет товары (все их вхождения) из категории и возвращает список удаленных.
+
+        Каждое вхождение удаляется за O(1): на его место переносится последний
+        товар списка (и его значения в колонках), поэтому порядок оставшихся
+        товаров после удаления может измениться.
+        """
+        removed = {}
+        with self.__lock:
+            for product in products:
+                rows = self.__rows.get(id(product))
+                if rows is None or id(product) in removed:
+                    continue
+                removed[id(product)] = (product, len(rows))
+                price, quantity = self.__values.pop(id(product))
+                self.__price_sum -= price * len(rows)
+                self.__quantity_sum -= quantity * len(rows)
+                self.__stock_value -= price * quantity * len(rows)
+                product.unsubscribe(self._on_product_change)
+                # От старших строк к младшим: перенос последней строки не задевает еще не удаленные
+                for row in sorted(rows, reverse=True):
+                    self.__remove_row(row)
+                del self.__rows[id(product)]
+                namesakes = self.__names[product.name]
+                namesakes.remove(product)
+                if not namesakes:
+                    del self.__names[product.name]
+            if not removed:
+                return []
+            self.__rendered = None
+
+        for product, occurrences in removed.values():
+            for _ in range(occurrences):
+                Category.product_count -= 1
+                for listener in tuple(self.__listeners):
+                    listener(self, "remove", product)
+        return [product for product, _ in removed.values()]
+
+    def __remove_row(self, row):
+        products = self.__products
+        last = len(products) - 1
+        if row != last:
+            moved = products[last]
+            products[row] = moved
+            moved_rows = self.__rows[id(moved)]
+            moved_rows[moved_rows.index(last)] = row
+            if self.columnar:
+                self.__prices[row] = self.__prices[last]
+                self.__quantities[row] = self.__quantities[last]
+        products.pop()
+        if self.columnar:
+            self.__prices.pop()
+            self.__quantities.pop()
+
+    def remove_product(self, product):
+        if not self.remove_products([product]):
+            raise ValueError(f"Товара {getattr(product, 'name', product)} нет в категории {self.name}")
+
+    def subscribe(self, listener):
+        """Подписывает listener(category, event, product) на добавление ("add") и удаление ("remove") товаров.
+
+        Событие приходит на каждое вхождение товара в категорию.
+        """
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def _on_product_change(self, product, field, old_value, new_value):
+        """Обновляет итоги и колонки при изменении цены или количества товара.
+
+        Уведомления о цене и остатке из разных потоков могут прийти в любом порядке,
+        поэтому под блокировкой берутся текущие цена и остаток товара, а разница
+        считается от значений, по которым товар учтен в категории. Итоги всегда
+        согласованы с этими значениями, а последнее уведомление приводит их к текущим.
+        """
+        with self.__lock:
+            values = self.__values.get(id(product))
+            if values is None:
+                return
+            price, quantity = product.price, product.quantity
+            old_price, old_quantity = values
+            if price == old_price and quantity == old_quantity:
+                return
+            if self.columnar:
+                self.__widen_quantities(quantity)
+            rows = self.__rows[id(product)]
+            self.__price_sum += (price - old_price) * len(rows)
+            self.__quantity_sum += (quantity - old_quantity) * len(rows)
+            self.__stock_value += (price * quantity - old_price * old_quantity) * len(rows)
+            if self.columnar:
+                for row in rows:
+                    self.__prices[row] = price
+                    self.__quantities[row] = quantity
+            values[0], values[1] = price, quantity
+            self.__rendered = None
+
+    def __widen_quantities(self, quantity):
+        """Переводит колонку остатков в float64, если количество не целое."""
+        if type(quantity) is not int and self.__quantities.typecode == "q":
+            self.__quantities = array("d", self.__quantities)
+
     def get_average_price(self):
         try:
             if not self.__products:
                 raise ZeroDivisionError("В категории нет товаров")
 
-            total_price = sum(product.price for product in self.__products)
-            average_price = total_price / len(self.__products)
+            average_price = self.__price_sum / len(self.__products)
             return average_price
 
         except ZeroDivisionError:
             return 0.0
 
+    def total_quantity(self):
+        """Суммарный остаток всех товаров категории."""
+        return self.__quantity_sum
+
+    def stock_value(self):
+        """Общая стоимость товаров на складе (цена * количество)."""
+        return self.__stock_value
+
+    def recalculate(self):
+        """Пересчитывает итоги с нуля: по колонкам, если они есть, иначе по учтенным ценам и остаткам товаров."""
+        with self.__lock:
+            if self.columnar:
+                self.__price_sum = sum(self.__prices)
+                self.__quantity_sum = sum(self.__quantities)
+                self.__stock_value = sum(map(operator.mul, self.__prices, self.__quantities))
+            else:
+                values = [self.__values[id(product)] for product in self.__products]
+                self.__price_sum = sum(price for price, _ in values)
+                self.__quantity_sum = sum(quantity for _, quantity in values)
+                self.__stock_value = sum(price * quantity for price, quantity in values)
+
     def __str__(self):
         return f"Категория: {self.name}, Описание: {self.description}, Продукты: {', '.join([p.name for p in self.products])}"
 
     @property
     def products(self):
-        """Геттер для получения списка продуктов в формате строки."""
+        """Геттер для получения списка продуктов в формате строки.
+
+        Строка кэшируется до следующего добавления товара или изменения его цены и количества.
+        """
         if not self.__products:
             return "Нет продуктов в категории."
 
-        return "\n".join(str(product) for product in self.__products)
+        if self.__rendered is None:
+            self.__rendered = "\n".join(self.iter_rendered())
+        return self.__rendered
+
+    def iter_rendered(self, offset=0, limit=None):
+        """Лениво отдает строки товаров, форматируя только запрошенный диапазон."""
+        products = self.__products
+        stop = len(products) if limit is None else min(offset + limit, len(products))
+        for index in range(offset, stop):
+            yield str(products[index])
+
+    def products_page(self, offset, limit):
+        """Возвращает страницу списка товаров: limit строк начиная с offset."""
+        if offset < 0 or limit < 0:
+            raise ValueError("Смещение и размер страницы не могут быть отрицательными")
+        return "\n".join(self.iter_rendered(offset, limit))
 
     def __iter__(self):
         """Возвращает итератор для перебора продуктов в категории."""
@@ -183,11 +597,11 @@ class Category(BaseEntity):
 
     def __str__(self):
         """Возвращает строковое представление категории."""
-        total_quantity = sum(product.quantity for product in self.__products)
-        return f"{self.name}, количество продуктов: {total_quantity} шт."
+        return f"{self.name}, количество продуктов: {self.total_quantity()} шт."
 
     def middle_price(self):
-        pass
+        """Средняя цена товаров категории по накопленным итогам (0 для пустой категории)."""
+        return self.get_average_price()
 
 
 class ProductIterator:
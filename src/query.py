@@ -0,0 +1,157 @@
+import heapq
+import operator
+from itertools import islice
+
+from src.search import tokenize
+
+
+class Query:
+    """Ленивый запрос к товарам категории.
+
+    Методы where, price_between, search, order_by, offset и limit возвращают
+    новый запрос и ничего не вычисляют. Товары отбираются генераторами только
+    при переборе результата. Если за категорией следят индексы (PriceIndex,
+    FacetIndex, SearchIndex), кандидаты берутся из них, а не перебором всех
+    товаров; сортировка с limit выполняется кучей (top-k), без полной сортировки.
+    """
+
+    def __init__(self, category):
+        self.__category = category
+        self.__predicates = []
+        self.__attributes = {}
+        self.__price_range = None
+        self.__text = None
+        self.__order = None  # (ключ, по убыванию, имя атрибута или None)
+        self.__offset = 0
+        self.__limit = None
+
+    def __copy(self):
+        query = Query(self.__category)
+        query.__predicates = list(self.__predicates)
+        query.__attributes = dict(self.__attributes)
+        query.__price_range = self.__price_range
+        query.__text = self.__text
+        query.__order = self.__order
+        query.__offset = self.__offset
+        query.__limit = self.__limit
+        return query
+
+    def where(self, predicate=None, **attributes):
+        """Фильтр по условию predicate(product) и/или по значениям атрибутов.
+
+        Значение атрибута может быть списком, кортежем или множеством — тогда подходит любое из них.
+        """
+        query = self.__copy()
+        if predicate is not None:
+            query.__predicates.append(predicate)
+        query.__attributes.update(attributes)
+        return query
+
+    def price_between(self, low, high):
+        query = self.__copy()
+        query.__price_range = (low, high)
+        return query
+
+    def search(self, text):
+        """Оставляет товары, в названии или описании которых есть все слова text (последнее — по началу)."""
+        query = self.__copy()
+        query.__text = text
+        return query
+
+    def order_by(self, key, descending=False):
+        """Сортировка по имени атрибута ("price", "-price" — по убыванию) или по функции."""
+        query = self.__copy()
+        attribute = None
+        if isinstance(key, str):
+            if key.startswith("-"):
+                key, descending = key[1:], not descending
+            attribute, key = key, operator.attrgetter(key)
+        query.__order = (key, descending, attribute)
+        return query
+
+    def offset(self, count):
+        query = self.__copy()
+        query.__offset = count
+        return query
+
+    def limit(self, count):
+        query = self.__copy()
+        query.__limit = count
+        return query
+
+    def __candidates(self):
+        """Источник кандидатов, примененные фильтры по атрибутам, признаки примененного поиска и сортировки по цене."""
+        category = self.__category
+        facets = category.get_index("facets")
+        if self.__attributes and facets is not None:
+            indexed = facets.indexed_attributes
+            filters = {name: value for name, value in self.__attributes.items() if name in indexed}
+            if filters:
+                return iter(facets.select(**filters)), set(filters), False, False
+        prices = category.get_index("price")
+        if self.__price_range is not None and prices is not None:
+            low, high = self.__price_range
+            return (product for product in prices.between(low, high) if product in category), set(), False, True
+        index = category.get_index("search")
+        if self.__text is not None and index is not None:
+            found = index.search(self.__text, limit=len(index))
+            return (product for product in found if product in category), set(), True, False
+        return iter(category), set(), False, False
+
+    def __iter__(self):
+        products, applied, text_applied, sorted_by_price = self.__candidates()
+
+        remaining = {name: value for name, value in self.__attributes.items() if name not in applied}
+        if remaining:
+            products = (product for product in products if _matches_attributes(product, remaining))
+        if self.__price_range is not None:
+            low, high = self.__price_range
+            products = (product for product in products if low <= product.price <= high)
+        if self.__text is not None and not text_applied:
+            words = tokenize(self.__text)
+            products = (product for product in products if _matches_text(product, words))
+        for predicate in self.__predicates:
+            products = filter(predicate, products)
+
+        stop = None if self.__limit is None else self.__offset + self.__limit
+        if self.__order is not None:
+            key, descending, attribute = self.__order
+            # Кандидаты из PriceIndex уже упорядочены по возрастанию цены
+            if not (sorted_by_price and attribute == "price" and not descending):
+                if stop is not None:
+                    select = heapq.nlargest if descending else heapq.nsmallest
+                    products = iter(select(stop, products, key=key))
+                else:
+                    products = iter(sorted(products, key=key, reverse=descending))
+        return islice(products, self.__offset, stop)
+
+    def all(self):
+        return list(self)
+
+    def first(self):
+        return next(iter(self.limit(1)), None)
+
+    def count(self):
+        return sum(1 for _ in self)
+
+
+def _matches_text(product, words):
+    tokens = tokenize(f"{product.name or ''} {product.description or ''}")
+    for position, word in enumerate(words):
+        if position == len(words) - 1:
+            if not any(token.startswith(word) for token in tokens):
+                return False
+        elif word not in tokens:
+            return False
+    return True
+
+
+def _matches_attributes(product, attributes):
+    for attribute, value in attributes.items():
+        actual = getattr(product, attribute, None)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if actual not in value:
+                return False
+        elif actual != value:
+            return False
+    return True
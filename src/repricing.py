@@ -0,0 +1,76 @@
+class AutoApprove:
+    """Политика подтверждения: любое изменение цены принимается."""
+
+    def __call__(self, product, old_price, new_price):
+        return None
+
+
+class RejectDecreases:
+    """Политика подтверждения: снижение цены отклоняется."""
+
+    def __call__(self, product, old_price, new_price):
+        if new_price < old_price:
+            return "Снижение цены запрещено политикой"
+        return None
+
+
+class ThresholdPolicy:
+    """Политика подтверждения: снижение цены больше чем на max_decrease (доля от 0 до 1) отклоняется."""
+
+    def __init__(self, max_decrease):
+        if not 0 <= max_decrease <= 1:
+            raise ValueError("Допустимое снижение задается долей от 0 до 1")
+        self.max_decrease = max_decrease
+
+    def __call__(self, product, old_price, new_price):
+        if new_price < old_price * (1 - self.max_decrease):
+            return f"Снижение цены больше {self.max_decrease:.0%} запрещено политикой"
+        return None
+
+
+class RepriceReport:
+    """Итог переоценки: примененные и отклоненные изменения вместо вывода в консоль."""
+
+    def __init__(self):
+        self.applied = []  # (товар, старая цена, новая цена)
+        self.rejected = []  # (товар, старая цена, новая цена, причина)
+
+    def __str__(self):
+        return f"Переоценено: {len(self.applied)}, отклонено: {len(self.rejected)}"
+
+
+def reprice(products, percent=None, amount=None, policy=None, where=None, ndigits=2):
+    """Переоценивает товары без диалога с пользователем и возвращает RepriceReport.
+
+    products — категория или любой набор товаров. Изменение задается либо
+    процентом percent (например, -10 — скидка 10%), либо суммой amount.
+    Вместо вопроса y/n из сеттера Product.price решение принимает политика
+    policy(product, old_price, new_price), возвращающая причину отказа или None;
+    по умолчанию применяется AutoApprove. where отбирает товары для переоценки.
+    Нулевые и отрицательные цены отклоняются без сообщений в консоль.
+    """
+    if (percent is None) == (amount is None):
+        raise ValueError("Нужно указать ровно одно изменение: percent или amount")
+    if policy is None:
+        policy = AutoApprove()
+
+    selected = [product for product in products if where is None or where(product)]
+    old_prices = [product.price for product in selected]
+    if percent is not None:
+        factor = 1 + percent / 100
+        new_prices = [round(price * factor, ndigits) for price in old_prices]
+    else:
+        new_prices = [round(price + amount, ndigits) for price in old_prices]
+
+    report = RepriceReport()
+    for product, old_price, new_price in zip(selected, old_prices, new_prices):
+        if new_price <= 0:
+            reason = "Цена не должна быть нулевая или отрицательная"
+        else:
+            reason = policy(product, old_price, new_price)
+        if reason is None:
+            product.price = new_price
+            report.applied.append((product, old_price, new_price))
+        else:
+            report.rejected.append((product, old_price, new_price, reason))
+    return report
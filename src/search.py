@@ -0,0 +1,153 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+
+WORD_PATTERN = re.compile(r"\w+")
+# Границы между цифрами и буквами: "200MP" -> "200", "mp"
+PART_PATTERN = re.compile(r"\d+|[^\W\d_]+")
+
+NAME_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+
+def tokenize(text):
+    """Разбивает смешанный русско-английский текст на токены в нижнем регистре.
+
+    Слова вида "256GB" дают и целый токен, и его части: "256gb", "256", "gb".
+    """
+    tokens = []
+    for word in WORD_PATTERN.findall(text.lower().replace("ё", "е")):
+        tokens.append(word)
+        parts = PART_PATTERN.findall(word)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class SearchIndex:
+    """Инвертированный индекс по названию и описанию товаров.
+
+    Индекс пополняется при Category.add_product у отслеживаемых категорий.
+    Поиск требует совпадения всех слов запроса (последнее может быть началом
+    слова) и ранжирует результаты по TF-IDF, совпадение в названии весит больше.
+    """
+
+    def __init__(self, categories=()):
+        self.__products = []  # номер документа -> товар
+        self.__documents = {}  # id(product) -> [номер документа, число вхождений]
+        self.__count = 0
+        self.__postings = {}  # токен -> {номер документа: вес}
+        # Отсортированные токены для поиска по префиксу. Новые токены только помечают
+        # словарь устаревшим, а сортирует его первый поиск по префиксу после изменений
+        self.__vocabulary = []
+        self.__vocabulary_dirty = False
+        for category in categories:
+            self.watch(category)
+
+    def watch(self, category):
+        for product in category:
+            self.add(product)
+        category.subscribe(self._on_category_event)
+        category.register_index("search", self)
+
+    def _on_category_event(self, category, event, product):
+        if event == "add":
+            self.add(product)
+        elif event == "remove":
+            self.remove(product)
+
+    def add(self, product):
+        entry = self.__documents.get(id(product))
+        if entry is not None:
+            entry[1] += 1
+            return
+        document = len(self.__products)
+        self.__products.append(product)
+        self.__documents[id(product)] = [document, 1]
+        self.__count += 1
+        for token, weight in self.__weights(product).items():
+            postings = self.__postings.get(token)
+            if postings is None:
+                postings = self.__postings[token] = {}
+                self.__vocabulary_dirty = True
+            postings[document] = weight
+
+    def remove(self, product):
+        """Убирает одно вхождение товара; документ удаляется вместе с последним."""
+        entry = self.__documents.get(id(product))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1]:
+            return
+        document = entry[0]
+        del self.__documents[id(product)]
+        self.__products[document] = None
+        self.__count -= 1
+        for token in self.__weights(product):
+            postings = self.__postings[token]
+            del postings[document]
+            if not postings:
+                del self.__postings[token]
+                self.__vocabulary_dirty = True
+
+    @staticmethod
+    def __weights(product):
+        weights = {}
+        for text, weight in ((product.name, NAME_WEIGHT), (product.description, DESCRIPTION_WEIGHT)):
+            for token in tokenize(text or ""):
+                weights[token] = weights.get(token, 0.0) + weight
+        return weights
+
+    def __expand(self, token, prefix):
+        if not prefix:
+            return [token] if token in self.__postings else []
+        if self.__vocabulary_dirty:
+            self.__vocabulary = sorted(self.__postings)
+            self.__vocabulary_dirty = False
+        vocabulary = self.__vocabulary
+        start = bisect_left(vocabulary, token)
+        stop = bisect_left(vocabulary, token + "\U0010ffff")
+        return vocabulary[start:stop]
+
+    def search(self, query, limit=10, prefix=True):
+        """Возвращает до limit товаров, подходящих под запрос, от лучшего к худшему."""
+        words = tokenize(query)
+        if not words or limit <= 0:
+            return []
+
+        total = self.__count
+        scores = None
+        for position, word in enumerate(words):
+            word_scores = {}
+            for token in self.__expand(word, prefix and position == len(words) - 1):
+                postings = self.__postings[token]
+                idf = math.log(1 + total / len(postings))
+                for document, weight in postings.items():
+                    score = weight * idf
+                    if score > word_scores.get(document, 0.0):
+                        word_scores[document] = score
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    document: score + word_scores[document]
+                    for document, score in scores.items()
+                    if document in word_scores
+                }
+            if not scores:
+                return []
+
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.__products[document] for document, _ in best]
+
+    def complete(self, prefix, limit=10):
+        """Подсказки для строки поиска: известные токены, начинающиеся с prefix."""
+        words = tokenize(prefix)
+        if not words:
+            return []
+        return self.__expand(words[-1], True)[:limit]
+
+    def __len__(self):
+        return self.__count
@@ -0,0 +1,303 @@
+"""Двоичный снимок каталога для быстрого старта.
+
+Формат (все числа little-endian, секции выровнены по 8 байт):
+
+* заголовок: сигнатура, версия, число категорий, товаров и строк, смещения секций
+  и код типа колонки количества ("q" или "d");
+* таблица категорий: номер строки имени и описания, первый товар и число товаров;
+* колонки товаров: цена (float64), количество (int64, а если среди остатков есть
+  дробные — float64), номер строки имени,
+  описания и дополнительных атрибутов (uint32), код класса (uint8);
+* таблица строк: смещения (uint64) и данные в UTF-8, одинаковые строки хранятся один раз.
+
+Файл открывается через mmap только для чтения, поэтому несколько процессов
+делят одни и те же страницы кэша ОС, а объекты Product создаются лишь при обращении.
+"""
+
+import json
+import mmap
+import operator
+import os
+import struct
+import tempfile
+from array import array
+
+from src.products import Category, LawnGrass, Product, Smartphone
+
+MAGIC = b"OSSNAP\x00\x01"
+VERSION = 2
+HEADER = struct.Struct("<8sIIQQ8Qc7x")
+CATEGORY = struct.Struct("<IIQQ")
+NO_STRING = 0xFFFFFFFF
+
+# Код класса -> (класс, дополнительные атрибуты в порядке конструктора)
+CLASSES = [
+    (Product, ()),
+    (Smartphone, ("efficiency", "model", "memory", "color")),
+    (LawnGrass, ("country", "germination_period", "color")),
+]
+CLASS_CODES = {cls: code for code, (cls, _) in enumerate(CLASSES)}
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def add(self, value):
+        if value is None:
+            return NO_STRING
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+
+def write_snapshot(path, categories):
+    """Записывает категории и их товары в двоичный снимок."""
+    strings = _StringTable()
+    category_rows = []
+    prices = array("d")
+    quantities = array("q")
+    name_ids = array("I")
+    description_ids = array("I")
+    extra_ids = array("I")
+    class_codes = array("B")
+
+    for category in categories:
+        first = len(prices)
+        for product in category:
+            code = CLASS_CODES.get(type(product))
+            if code is None:
+                raise TypeError(f"Класс {type(product).__name__} не поддерживается форматом снимка")
+            prices.append(product.price)
+            if type(product.quantity) is not int and quantities.typecode == "q":
+                # Как и в колоночной категории, колонка расширяется до float64 при первом дробном остатке
+                quantities = array("d", quantities)
+            quantities.append(product.quantity)
+            name_ids.append(strings.add(product.name))
+            description_ids.append(strings.add(product.description))
+            extra = CLASSES[code][1]
+            extra_ids.append(
+                strings.add(json.dumps([getattr(product, field) for field in extra], ensure_ascii=False))
+                if extra
+                else NO_STRING
+            )
+            class_codes.append(code)
+        category_rows.append(
+            CATEGORY.pack(
+                strings.add(category.name), strings.add(category.description), first, len(prices) - first
+            )
+        )
+
+    encoded = [value.encode("UTF-8") for value in strings.strings]
+    string_offsets = array("Q", [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    sections = [
+        b"".join(category_rows),
+        prices.tobytes(),
+        quantities.tobytes(),
+        name_ids.tobytes(),
+        description_ids.tobytes(),
+        extra_ids.tobytes(),
+        class_codes.tobytes(),
+        string_offsets.tobytes(),
+        b"".join(encoded),
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections[:-1]:
+        position = _align(position)
+        offsets.append(position)
+        position += len(section)
+    position = _align(position)
+    offsets.append(position)
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(category_rows),
+        len(prices),
+        len(encoded),
+        *offsets[1:],
+        quantities.typecode.encode("ascii"),
+    )
+    # Снимок собирается во временном файле рядом с целевым и подменяет его атомарно:
+    # процессы, которые держат старый снимок в mmap, продолжают читать прежний файл
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(header)
+            for offset, section in zip(offsets, sections):
+                file.write(b"\0" * (offset - file.tell()))
+                file.write(section)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp создает файл с правами 0600, снимок же должны читать и другие процессы
+        os.chmod(temporary, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class Snapshot:
+    """Снимок каталога, открытый через mmap."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, category_count, product_count, string_count, *offsets, typecode = HEADER.unpack_from(
+            self.__mmap
+        )
+        if magic != MAGIC or version != VERSION or typecode not in (b"q", b"d"):
+            self.__mmap.close()
+            raise ValueError(f"Файл {path} не является снимком каталога версии {VERSION}")
+        (
+            prices_at,
+            quantities_at,
+            names_at,
+            descriptions_at,
+            extras_at,
+            classes_at,
+            string_offsets_at,
+            strings_at,
+        ) = offsets
+        view = memoryview(self.__mmap)
+        self.__view = view
+        n = product_count
+        self.prices = view[prices_at:prices_at + 8 * n].cast("d")
+        self.quantities = view[quantities_at:quantities_at + 8 * n].cast(typecode.decode("ascii"))
+        self.__names = view[names_at:names_at + 4 * n].cast("I")
+        self.__descriptions = view[descriptions_at:descriptions_at + 4 * n].cast("I")
+        self.__extras = view[extras_at:extras_at + 4 * n].cast("I")
+        self.__classes = view[classes_at:classes_at + n]
+        self.__string_offsets = view[string_offsets_at:string_offsets_at + 8 * (string_count + 1)].cast("Q")
+        self.__strings_at = strings_at
+        self.__string_cache = {}
+        self.__categories = [
+            SnapshotCategory(self, *CATEGORY.unpack_from(view, HEADER.size + index * CATEGORY.size))
+            for index in range(category_count)
+        ]
+
+    def string(self, string_id):
+        if string_id == NO_STRING:
+            return None
+        value = self.__string_cache.get(string_id)
+        if value is None:
+            start = self.__strings_at + self.__string_offsets[string_id]
+            stop = self.__strings_at + self.__string_offsets[string_id + 1]
+            value = self.__string_cache[string_id] = str(self.__view[start:stop], "UTF-8")
+        return value
+
+    def quantity(self, row):
+        """Остаток товара; целые значения из колонки float64 возвращаются как int."""
+        quantity = self.quantities[row]
+        if type(quantity) is float and quantity.is_integer():
+            return int(quantity)
+        return quantity
+
+    def product(self, row):
+        """Создает объект товара по номеру строки снимка."""
+        cls, extra = CLASSES[self.__classes[row]]
+        attributes = {}
+        if extra:
+            attributes = dict(zip(extra, json.loads(self.string(self.__extras[row]))))
+        return cls.restore(
+            self.string(self.__names[row]),
+            self.string(self.__descriptions[row]),
+            self.prices[row],
+            self.quantity(row),
+            **attributes,
+        )
+
+    def categories(self):
+        return list(self.__categories)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def close(self):
+        # Представления нужно освободить до закрытия mmap
+        for category in self.__categories:
+            category.release()
+        for view in (
+            self.prices,
+            self.quantities,
+            self.__names,
+            self.__descriptions,
+            self.__extras,
+            self.__classes,
+            self.__string_offsets,
+            self.__view,
+        ):
+            view.release()
+        self.__mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class SnapshotCategory:
+    """Категория снимка: агрегаты считаются по колонкам, товары создаются лениво."""
+
+    def __init__(self, snapshot, name_id, description_id, first, count):
+        self.__snapshot = snapshot
+        self.name = snapshot.string(name_id)
+        self.description = snapshot.string(description_id)
+        self.__first = first
+        self.__count = count
+        self.__products = {}
+        self.__prices = snapshot.prices[first:first + count]
+        self.__quantities = snapshot.quantities[first:first + count]
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("Номер товара вне категории")
+        product = self.__products.get(index)
+        if product is None:
+            product = self.__products[index] = self.__snapshot.product(self.__first + index)
+        return product
+
+    def __iter__(self):
+        for index in range(self.__count):
+            yield self[index]
+
+    def get_average_price(self):
+        return sum(self.__prices) / self.__count if self.__count else 0.0
+
+    def total_quantity(self):
+        return sum(self.__quantities)
+
+    def stock_value(self):
+        return sum(map(operator.mul, self.__prices, self.__quantities))
+
+    def __str__(self):
+        return f"{self.name}, количество продуктов: {self.total_quantity()} шт."
+
+    def to_category(self, columnar=False):
+        """Материализует полноценную Category со всеми товарами."""
+        category = Category(self.name, self.description, [], columnar=columnar)
+        for product in self:
+            category.add_product(product)
+        return category
+
+    def release(self):
+        self.__prices.release()
+        self.__quantities.release()
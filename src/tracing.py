@@ -0,0 +1,66 @@
+import itertools
+import logging
+from collections import deque
+
+CREATION_MESSAGE = "Создан объект класса %s с параметрами: %s, %s"
+
+
+def format_creation(cls, args, kwargs):
+    """Формирует сообщение о создании объекта (только по запросу)."""
+    return CREATION_MESSAGE % (cls.__name__, args, kwargs)
+
+
+class PrintTracer:
+    """Печатает сообщение в консоль, как это делал миксин раньше."""
+
+    def __call__(self, cls, args, kwargs):
+        print(format_creation(cls, args, kwargs))
+
+
+class RingBufferTracer:
+    """Хранит последние записи о создании объектов в памяти.
+
+    Строки не форматируются при записи, только при чтении через records().
+    """
+
+    def __init__(self, capacity=1000):
+        self.__records = deque(maxlen=capacity)
+
+    def __call__(self, cls, args, kwargs):
+        self.__records.append((cls, args, kwargs))
+
+    def __len__(self):
+        return len(self.__records)
+
+    def records(self):
+        return [format_creation(cls, args, kwargs) for cls, args, kwargs in self.__records]
+
+    def clear(self):
+        self.__records.clear()
+
+
+class LoggingTracer:
+    """Передает записи в модуль logging с отложенным форматированием."""
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger if logger is not None else logging.getLogger("src.products")
+        self.level = level
+
+    def __call__(self, cls, args, kwargs):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, CREATION_MESSAGE, cls.__name__, args, kwargs)
+
+
+class SampledTracer:
+    """Передает дальше только каждое N-е создание объекта."""
+
+    def __init__(self, tracer, every):
+        if every <= 0:
+            raise ValueError("Частота выборки должна быть положительной")
+        self.tracer = tracer
+        self.every = every
+        self.__counter = itertools.count()
+
+    def __call__(self, cls, args, kwargs):
+        if next(self.__counter) % self.every == 0:
+            self.tracer(cls, args, kwargs)
@@ -1,7 +1,12 @@
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-from pandas import read_json
+from src.interning import intern_value
+from src.products import Category, Product, ProductIndex
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
 
 
 def load_json(path: str) -> dict:
@@ -11,6 +16,161 @@ def load_json(path: str) -> dict:
     return data
 
 
+def iter_json_array(path: str, chunk_size: int = CHUNK_SIZE):
+    """По одному отдает элементы JSON-массива верхнего уровня, не читая файл целиком.
+
+    В памяти держится текущий элемент и прочитанный блок файла (для большого
+    элемента блок растет до размера порядка самого элемента).
+    """
+    decoder = json.JSONDecoder()
+    full_path = os.path.abspath(path)
+    with open(full_path, "r", encoding="UTF-8") as file:
+        buffer = ""
+        pos = 0
+        eof = False
+        expect = "["
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"Неожиданный конец файла {path}")
+                buffer = file.read(chunk_size)
+                pos = 0
+                eof = not buffer
+                continue
+
+            char = buffer[pos]
+            if expect == "[":
+                if char != "[":
+                    raise ValueError(f"Ожидается JSON-массив в файле {path}")
+                pos += 1
+                expect = "item"
+            elif char == "]" and expect in ("item", "separator"):
+                return
+            elif expect == "separator":
+                if char != ",":
+                    raise ValueError(f"Ожидается ',' в позиции {pos} файла {path}")
+                pos += 1
+                expect = "item"
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    item, end = None, None
+                # Элемент может быть обрезан границей блока: дочитываем и пробуем снова.
+                # Объем дочитывания удваивается, поэтому большой элемент разбирается
+                # повторно лишь O(log n) раз, а суммарная работа остается линейной.
+                if end is None or (not eof and (end == len(buffer) or buffer[end] not in WHITESPACE + ",]")):
+                    if eof:
+                        raise ValueError(f"Некорректный JSON в файле {path}")
+                    chunk = file.read(max(chunk_size, len(buffer) - pos))
+                    eof = not chunk
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+                    continue
+                pos = end
+                expect = "separator"
+                yield item
+
+
+def iter_categories(path: str, chunk_size: int = CHUNK_SIZE):
+    """Потоково строит категории из файла вида [{"name", "description", "products": [...]}].
+
+    Каждая категория отдается сразу после разбора, поэтому пиковая память
+    ограничена самой большой категорией, а не всем файлом.
+    """
+    for category_info in iter_json_array(path, chunk_size):
+        yield build_category(category_info)
+
+
+def build_category(category_info: dict) -> Category:
+    """Создает категорию и ее товары из словаря, дубликаты товаров сливаются."""
+    category = Category(category_info.get("name"), category_info.get("description"), [])
+    for product in Product.new_products(category_info.get("products", ())):
+        category.add_product(product)
+    return category
+
+
+def load_categories(path: str) -> list:
+    return list(iter_categories(path))
+
+
+def parse_shard(path: str) -> list:
+    """Разбирает и проверяет один файл-шард в компактные записи без создания объектов Product.
+
+    Возвращает [(имя категории, описание, [(имя, описание, цена, количество), ...]), ...].
+    Повторы товара внутри категории шарда сразу сливаются по правилам new_product:
+    количество складывается, цена берется максимальная, описание — первое.
+    """
+    shard = []
+    for category_info in iter_json_array(path):
+        merged = {}
+        for product_info in category_info.get("products", ()):
+            name = product_info.get("name")
+            price = product_info.get("price")
+            quantity = product_info.get("quantity")
+            if not isinstance(price, (int, float)) or price <= 0:
+                raise ValueError(f"{path}: у товара {name} некорректная цена {price!r}")
+            if not isinstance(quantity, (int, float)) or quantity <= 0:
+                raise ValueError(f"{path}: у товара {name} некорректное количество {quantity!r}")
+            record = merged.get(name)
+            if record is None:
+                # Общий экземпляр описания pickle передает из процесса-обработчика один раз
+                merged[name] = [name, intern_value(product_info.get("description")), price, quantity]
+            else:
+                record[2] = max(record[2], price)
+                record[3] += quantity
+        records = [tuple(record) for record in merged.values()]
+        shard.append((category_info.get("name"), category_info.get("description"), records))
+    return shard
+
+
+def load_shards(paths, processes=None) -> list:
+    """Загружает каталог из нескольких файлов-шардов, разбирая их параллельно в пуле процессов.
+
+    Категории с одинаковым именем из разных шардов объединяются, а товары
+    сливаются по правилам Product.new_product в порядке шардов, поэтому
+    результат совпадает с последовательной загрузкой (processes=1).
+    """
+    paths = list(paths)
+    if processes == 1 or len(paths) <= 1:
+        return merge_shards(map(parse_shard, paths))
+    with ProcessPoolExecutor(processes) as pool:
+        return merge_shards(pool.map(parse_shard, paths))
+
+
+def merge_shards(shards) -> list:
+    """Собирает категории из записей parse_shard.
+
+    Внутри шарда записи уже слиты, поэтому товар создается прямо из кортежа,
+    повтор из другого шарда сливается через Product.merge без промежуточных словарей,
+    а новые товары добавляются в категорию одной пачкой (Category.add_products).
+    """
+    categories = {}  # имя -> (Category, ProductIndex)
+    for shard in shards:
+        for name, description, records in shard:
+            entry = categories.get(name)
+            if entry is None:
+                entry = categories[name] = (Category(name, description, []), ProductIndex())
+            category, index = entry
+            added = []
+            for product_name, product_description, price, quantity in records:
+                product = index.get(product_name)
+                if product is None:
+                    product = Product(product_name, product_description, price, quantity)
+                    index.add(product)
+                    added.append(product)
+                else:
+                    product.merge(price, quantity)
+            category.add_products(added)
+    return [category for category, _ in categories.values()]
+
+
 if __name__ == "__main__":
+    # pandas импортируется только здесь: обычный импорт модуля не должен платить за его загрузку
+    from pandas import read_json
+
     data = read_json("../data/products.json")
     print(data)
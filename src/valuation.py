@@ -0,0 +1,23 @@
+from src.products import Product
+
+
+def inventory_value(products, by_class=False):
+    """Стоимость склада (цена * количество) для категории или любого набора товаров за один проход.
+
+    Как и при сложении товаров через +, складывать можно только товары одного
+    класса: при смешении классов возникает TypeError. С by_class=True
+    возвращается словарь {класс: стоимость}, и смешанные наборы допустимы.
+    """
+    totals = {}
+    for product in products:
+        if not isinstance(product, Product):
+            raise TypeError(f"Ожидается объект типа Product, получен {type(product).__name__}.")
+        cls = type(product)
+        totals[cls] = totals.get(cls, 0) + product.price * product.quantity
+
+    if by_class:
+        return totals
+    if len(totals) > 1:
+        names = ", ".join(cls.__name__ for cls in totals)
+        raise TypeError(f"Нельзя складывать товары разных классов: {names}")
+    return sum(totals.values())
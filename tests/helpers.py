@@ -0,0 +1,13 @@
+from src.products import Category
+
+
+class CategoryCountersMixin:
+    """Сохраняет общие счетчики Category.category_count и Category.product_count и восстанавливает их после теста."""
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(self.__restore_counters, Category.category_count, Category.product_count)
+
+    @staticmethod
+    def __restore_counters(category_count, product_count):
+        Category.category_count, Category.product_count = category_count, product_count
@@ -0,0 +1,80 @@
+import threading
+import unittest
+
+from src.catalog import Catalog
+from src.products import Category, Product
+from tests.helpers import CategoryCountersMixin
+
+
+class TestCatalog(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.phones = Category("Смартфоны", "Категория смартфонов", [])
+        self.iphone = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+        self.phones.add_product(self.iphone)
+        self.tvs = Category("Телевизоры", "Современные телевизоры", [])
+        self.catalog = Catalog([self.phones, self.tvs])
+
+    def test_existing_products_indexed(self):
+        self.assertIs(self.catalog.get_product("Iphone 15"), self.iphone)
+        self.assertIs(self.catalog.category_of("Iphone 15"), self.phones)
+        self.assertEqual(self.catalog.category_count, 2)
+        self.assertEqual(self.catalog.product_count, 1)
+
+    def test_lookup_category(self):
+        self.assertIs(self.catalog.get_category("Телевизоры"), self.tvs)
+        self.assertIn("Смартфоны", self.catalog)
+        self.assertIsNone(self.catalog.get_category("Ноутбуки"))
+        self.assertEqual(list(self.catalog), [self.phones, self.tvs])
+
+    def test_add_product_through_catalog(self):
+        tv = Product('55" QLED 4K', "Фоновая подсветка", 123000.0, 7)
+        self.catalog.add_product("Телевизоры", tv)
+        self.assertIs(self.catalog.get_product('55" QLED 4K'), tv)
+        self.assertIs(self.catalog.category_of('55" QLED 4K'), self.tvs)
+        self.assertEqual(self.catalog.product_count, 2)
+
+    def test_direct_add_to_category_is_tracked(self):
+        tv = Product('55" QLED 4K', "Фоновая подсветка", 123000.0, 7)
+        self.tvs.add_product(tv)
+        self.assertIs(self.catalog.get_product('55" QLED 4K'), tv)
+
+    def test_category_of_follows_removal_from_first_category(self):
+        self.tvs.add_product(self.iphone)
+        self.phones.remove_product(self.iphone)
+        self.assertIs(self.catalog.category_of("Iphone 15"), self.tvs)
+        self.assertIs(self.catalog.get_product("Iphone 15"), self.iphone)
+        self.tvs.remove_product(self.iphone)
+        self.assertIsNone(self.catalog.category_of("Iphone 15"))
+
+    def test_catalogs_are_independent(self):
+        other = Catalog()
+        other.add_category(Category("Ноутбуки", "Категория ноутбуков", []))
+        self.assertEqual(other.category_count, 1)
+        self.assertEqual(other.product_count, 0)
+        self.assertEqual(self.catalog.category_count, 2)
+
+    def test_duplicate_category_name(self):
+        with self.assertRaises(ValueError):
+            self.catalog.add_category(Category("Смартфоны", "Дубликат", []))
+
+    def test_add_invalid_category(self):
+        with self.assertRaises(TypeError):
+            self.catalog.add_category("некатегория")
+
+    def test_concurrent_adds(self):
+        def worker(number):
+            for index in range(200):
+                self.catalog.add_product("Телевизоры", Product(f"ТВ {number}-{index}", "Телевизор", 1000, 1))
+
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.catalog.product_count, 801)
+        self.assertEqual(self.tvs.total_quantity(), 800)
+
+
+if __name__ == "__main__":
+    unittest.main()
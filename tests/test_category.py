@@ -0,0 +1,207 @@
+import sys
+import threading
+import unittest
+
+from src.products import Category, Product, Smartphone
+from tests.helpers import CategoryCountersMixin
+
+
+class TestColumnarCategory(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Смартфоны", "Категория смартфонов", [], columnar=True)
+        self.plain = Category("Смартфоны", "Категория смартфонов", [])
+        self.product1 = Product("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5)
+        self.product2 = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.product3 = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+        for product in (self.product1, self.product2, self.product3):
+            self.category.add_product(product)
+            self.plain.add_product(product)
+
+    def assert_same_aggregates(self):
+        self.assertEqual(self.category.get_average_price(), self.plain.get_average_price())
+        self.assertEqual(self.category.total_quantity(), self.plain.total_quantity())
+        self.assertEqual(self.category.stock_value(), self.plain.stock_value())
+
+    def test_fractional_quantity(self):
+        sugar = Product("Сахар", "Весовой, кг", 80, 1.5)
+        self.category.add_product(sugar)
+        self.plain.add_product(sugar)
+        self.assertEqual(len(self.category), 4)
+        self.assert_same_aggregates()
+        self.assertEqual(self.category.total_quantity(), 28.5)
+        self.product1.quantity = 2.25
+        prices, quantities = self.category.columns()
+        self.assertEqual(quantities.typecode, "d")
+        self.assertEqual(list(quantities), [2.25, 8, 14, 1.5])
+        self.assertEqual(list(self.plain.columns()[1]), [2.25, 8, 14, 1.5])
+        self.category.recalculate()
+        self.assert_same_aggregates()
+
+    def test_mode_flag(self):
+        self.assertTrue(self.category.columnar)
+        self.assertFalse(self.plain.columnar)
+
+    def test_aggregates(self):
+        self.assertEqual(self.category.get_average_price(), 140333.33333333334)
+        self.assertEqual(self.category.total_quantity(), 27)
+        self.assertEqual(self.category.stock_value(), 180000.0 * 5 + 210000.0 * 8 + 31000.0 * 14)
+        self.assertEqual(str(self.category), "Смартфоны, количество продуктов: 27 шт.")
+        self.assert_same_aggregates()
+
+    def test_columns_follow_price_and_quantity(self):
+        self.product2.price = 200000.0
+        self.product3.quantity -= 4
+        self.assert_same_aggregates()
+        self.assertEqual(self.category.total_quantity(), 23)
+
+    def test_invalid_price_does_not_change_columns(self):
+        self.product1.price = -1
+        self.assertEqual(self.category.get_average_price(), 140333.33333333334)
+
+    def test_same_product_added_twice(self):
+        self.category.add_product(self.product1)
+        self.plain.add_product(self.product1)
+        self.product1.quantity = 1
+        self.assert_same_aggregates()
+
+    def test_add_products_batch(self):
+        bulk = Category("Смартфоны", "Категория смартфонов", [], columnar=True)
+        events = []
+        bulk.subscribe(lambda category, event, product: events.append((event, product)))
+        products = [self.product1, self.product2, self.product3, self.product1]
+        bulk.add_products(products)
+        self.plain.add_product(self.product1)
+        self.assertEqual(list(bulk), products)
+        self.assertEqual(events, [("add", product) for product in products])
+        self.assertEqual(list(bulk.columns()[0]), [180000.0, 210000.0, 31000.0, 180000.0])
+        self.product1.price = 1000.0
+        self.assertEqual(bulk.stock_value(), self.plain.stock_value())
+        self.assertIs(bulk.find_product("Iphone 15"), self.product2)
+        with self.assertRaises(TypeError):
+            bulk.add_products([Product("Чехол", "Силикон", 500.0, 3), "непродукт"])
+        self.assertEqual(len(bulk), 4)
+
+    def test_empty_category(self):
+        empty = Category("Пустая категория", "Нет продуктов", [], columnar=True)
+        self.assertEqual(empty.get_average_price(), 0.0)
+        self.assertEqual(empty.total_quantity(), 0)
+        self.assertEqual(empty.stock_value(), 0)
+
+
+class TestCategoryTotals(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Фрукты", "Разнообразные фрукты", [])
+        self.apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.orange = Product("Апельсин", "Сладкий апельсин", 70, 5)
+        self.category.add_product(self.apple)
+        self.category.add_product(self.orange)
+
+    def test_totals_after_add(self):
+        self.assertEqual(self.category.get_average_price(), 60.0)
+        self.assertEqual(self.category.total_quantity(), 15)
+        self.assertEqual(self.category.stock_value(), 850)
+
+    def test_totals_follow_setters(self):
+        self.apple.price = 90
+        self.orange.quantity = 1
+        self.assertEqual(self.category.get_average_price(), 80.0)
+        self.assertEqual(self.category.total_quantity(), 11)
+        self.assertEqual(self.category.stock_value(), 970)
+
+    def test_totals_follow_new_product_merge(self):
+        Product.new_product({"name": "Яблоко", "description": "", "price": 60, "quantity": 5}, [self.apple])
+        self.assertEqual(self.category.total_quantity(), 20)
+        self.assertEqual(self.category.stock_value(), 60 * 15 + 70 * 5)
+
+    def test_product_shared_between_categories(self):
+        other = Category("Цитрусовые", "Апельсины и лимоны", [])
+        other.add_product(self.orange)
+        self.orange.quantity = 10
+        self.assertEqual(self.category.total_quantity(), 20)
+        self.assertEqual(other.total_quantity(), 10)
+
+    def test_recalculate_matches_running_totals(self):
+        self.apple.price = 55
+        self.orange.quantity = 7
+        expected = (self.category.get_average_price(), self.category.total_quantity(), self.category.stock_value())
+        self.category.recalculate()
+        self.assertEqual(
+            (self.category.get_average_price(), self.category.total_quantity(), self.category.stock_value()), expected
+        )
+
+    def test_concurrent_price_and_quantity_changes(self):
+        self.category.add_product(self.apple)
+        changes = threading.Barrier(4)
+
+        def worker(number):
+            changes.wait()
+            for step in range(2000):
+                if number % 2:
+                    self.apple.price = 40 + (step + number) % 7
+                else:
+                    self.apple.quantity = 1 + (step * number) % 11
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Частые переключения потоков между присваиванием и уведомлением
+        self.addCleanup(sys.setswitchinterval, interval)
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expected = 2 * self.apple.price * self.apple.quantity + 70 * 5
+        self.assertEqual(self.category.stock_value(), expected)
+        self.assertEqual(self.category.total_quantity(), 2 * self.apple.quantity + 5)
+
+    def test_middle_price(self):
+        self.assertEqual(self.category.middle_price(), 60.0)
+        empty = Category("Пустая категория", "Категория без продуктов", [])
+        self.assertEqual(empty.middle_price(), 0.0)
+
+
+class TestCategoryRendering(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Фрукты", "Разнообразные фрукты", [])
+        self.apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.orange = Product("Апельсин", "Сладкий апельсин", 70, 5)
+        self.pear = Product("Груша", "Спелая груша", 80, 3)
+        for product in (self.apple, self.orange, self.pear):
+            self.category.add_product(product)
+
+    def test_products_cached(self):
+        self.assertIs(self.category.products, self.category.products)
+
+    def test_cache_invalidated_on_add(self):
+        self.category.products
+        self.category.add_product(Product("Слива", "Синяя слива", 40, 7))
+        self.assertTrue(self.category.products.endswith("Слива, 40 руб. Остаток: 7 шт."))
+
+    def test_cache_invalidated_on_product_change(self):
+        self.category.products
+        self.apple.price = 55
+        self.orange.quantity = 2
+        self.assertEqual(
+            self.category.products,
+            "Яблоко, 55 руб. Остаток: 10 шт.\nАпельсин, 70 руб. Остаток: 2 шт.\nГруша, 80 руб. Остаток: 3 шт.",
+        )
+
+    def test_iter_rendered(self):
+        rendered = self.category.iter_rendered(offset=1)
+        self.assertEqual(next(rendered), "Апельсин, 70 руб. Остаток: 5 шт.")
+        self.assertEqual(list(rendered), ["Груша, 80 руб. Остаток: 3 шт."])
+
+    def test_products_page(self):
+        self.assertEqual(self.category.products_page(1, 1), "Апельсин, 70 руб. Остаток: 5 шт.")
+        self.assertEqual(self.category.products_page(2, 10), "Груша, 80 руб. Остаток: 3 шт.")
+        self.assertEqual(self.category.products_page(5, 10), "")
+
+    def test_products_page_invalid(self):
+        with self.assertRaises(ValueError):
+            self.category.products_page(-1, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.cli import main
+from src.snapshot import Snapshot
+from tests.helpers import CategoryCountersMixin
+
+CATALOG = [
+    {
+        "name": "Смартфоны",
+        "description": "Смартфоны",
+        "products": [
+            {"name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8},
+            {"name": "Xiaomi Redmi Note 11", "description": "1024GB, Синий", "price": 31000.0, "quantity": 14},
+        ],
+    },
+    {
+        "name": "Телевизоры",
+        "description": "Телевизоры",
+        "products": [{"name": '55" QLED 4K', "description": "Фоновая подсветка", "price": 123000.0, "quantity": 7}],
+    },
+]
+
+
+class TestStoreCli(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.catalog = os.path.join(self.directory.name, "catalog.json")
+        self.snapshot = os.path.join(self.directory.name, "catalog.snap")
+        with open(self.catalog, "w", encoding="UTF-8") as file:
+            json.dump(CATALOG, file, ensure_ascii=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main(list(argv)), 0)
+        return output.getvalue()
+
+    def test_load_and_report(self):
+        output = self.run_cli("load", self.catalog, "--snapshot", self.snapshot)
+        self.assertIn("Категорий: 2, товаров: 3", output)
+        from_json = self.run_cli("report", self.catalog)
+        from_snapshot = self.run_cli("report", self.snapshot)
+        self.assertEqual(from_json, from_snapshot)
+        self.assertIn("Смартфоны", from_snapshot)
+        self.assertIn("120500.00", from_snapshot)
+
+    def test_search(self):
+        self.run_cli("load", self.catalog, "--snapshot", self.snapshot)
+        output = self.run_cli("search", self.snapshot, "сини")
+        self.assertEqual(output.strip(), "Xiaomi Redmi Note 11, 31000.0 руб. Остаток: 14 шт.")
+        self.assertIn("Ничего не найдено", self.run_cli("search", self.catalog, "холодильник"))
+
+    def test_reprice_to_snapshot(self):
+        output = self.run_cli(
+            "reprice", self.catalog, "--percent", "-10", "--category", "Смартфоны", "--output", self.snapshot
+        )
+        self.assertIn("Переоценено: 2, отклонено: 0", output)
+        with Snapshot(self.snapshot) as snapshot:
+            self.assertEqual(list(snapshot.prices), [189000.0, 27900.0, 123000.0])
+
+    def test_reprice_snapshot_in_place(self):
+        self.run_cli("load", self.catalog, "--snapshot", self.snapshot)
+        with Snapshot(self.snapshot) as before:
+            self.run_cli("reprice", self.snapshot, "--amount", "1000", "--output", self.snapshot)
+            # Открытый снимок продолжает читать прежний файл
+            self.assertEqual(list(before.prices), [210000.0, 31000.0, 123000.0])
+        with Snapshot(self.snapshot) as after:
+            self.assertEqual(list(after.prices), [211000.0, 32000.0, 124000.0])
+
+    def test_reprice_policy(self):
+        output = self.run_cli("reprice", self.catalog, "--percent", "-10", "--no-decrease")
+        self.assertIn("Переоценено: 0, отклонено: 3", output)
+        self.assertIn("Изменения не сохранены", output)
+
+    def test_errors(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit) as raised:
+                main(["report", os.path.join(self.directory.name, "missing.json")])
+            self.assertEqual(raised.exception.code, 1)
+            with self.assertRaises(SystemExit):
+                main(["reprice", self.catalog])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import importlib.util
+import subprocess
+import sys
+import unittest
+
+from src.columnar import category_from_arrow, category_from_dataframe, category_to_arrow, category_to_dataframe
+from src.products import Category, Product, Smartphone
+from tests.helpers import CategoryCountersMixin
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+SMARTPHONE_ATTRIBUTES = ("efficiency", "model", "memory", "color")
+
+
+class TestColumnarBridge(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Смартфоны", "Высокотехнологичные смартфоны", [], columnar=True)
+        self.category.add_product(
+            Smartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый")
+        )
+        self.category.add_product(
+            Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        )
+
+    def assert_same_products(self, category):
+        self.assertEqual(
+            [(product.name, product.price, product.quantity, product.color) for product in category],
+            [(product.name, product.price, product.quantity, product.color) for product in self.category],
+        )
+
+    def test_columns(self):
+        prices, quantities = self.category.columns()
+        self.assertEqual(list(prices), [180000.0, 210000.0])
+        self.assertEqual(list(quantities), [5, 8])
+        plain = Category("Смартфоны", "Смартфоны", list(self.category))
+        plain.add_product(Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14))
+        self.assertEqual(list(plain.columns()[0]), [31000.0])
+
+    def test_utils_import_does_not_load_pandas(self):
+        code = "import sys, src.utils, src.columnar; print('pandas' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas не установлен")
+    def test_dataframe_round_trip(self):
+        frame = category_to_dataframe(self.category, SMARTPHONE_ATTRIBUTES)
+        self.assertEqual(list(frame.columns), ["name", "description", "price", "quantity", *SMARTPHONE_ATTRIBUTES])
+        self.assertEqual(frame["price"].sum(), 390000.0)
+        self.assertEqual(frame["quantity"].tolist(), [5, 8])
+
+        category = category_from_dataframe(
+            frame, "Смартфоны", "Копия", cls=Smartphone, attributes=SMARTPHONE_ATTRIBUTES, columnar=True
+        )
+        self.assert_same_products(category)
+        self.assertIsInstance(category.find_product("Iphone 15").quantity, int)
+        self.assertEqual(category.stock_value(), self.category.stock_value())
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas не установлен")
+    def test_dataframe_fractional_quantity(self):
+        self.category.add_product(Product("Сахар", "Весовой, кг", 80, 1.5))
+        frame = category_to_dataframe(self.category)
+        self.assertEqual(frame["quantity"].tolist(), [5, 8, 1.5])
+        category = category_from_dataframe(frame, "Копия", "Копия", columnar=True)
+        self.assertEqual(category.total_quantity(), 14.5)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow не установлен")
+    def test_arrow_round_trip(self):
+        table = category_to_arrow(self.category, SMARTPHONE_ATTRIBUTES)
+        self.assertEqual(table.column("price").to_pylist(), [180000.0, 210000.0])
+        category = category_from_arrow(table, "Смартфоны", "Копия", cls=Smartphone, attributes=SMARTPHONE_ATTRIBUTES)
+        self.assert_same_products(category)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import unittest
+
+from src.catalog import Catalog
+from src.delta import apply_delta
+from src.facets import FacetIndex
+from src.price_index import PriceIndex
+from src.products import Category, Product, Smartphone
+from src.search import SearchIndex
+from tests.helpers import CategoryCountersMixin
+
+
+class TestApplyDelta(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.fruits = Category("Фрукты", "Разнообразные фрукты", [])
+        self.apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.orange = Product("Апельсин", "Сладкий апельсин", 70, 5)
+        self.fruits.add_product(self.apple)
+        self.fruits.add_product(self.orange)
+        self.catalog = Catalog([self.fruits])
+
+    def test_upsert_merges_and_adds(self):
+        report = apply_delta(
+            self.catalog,
+            [
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Яблоко", "price": 60, "quantity": 5}},
+                {
+                    "op": "upsert",
+                    "category": "Фрукты",
+                    "product": {"name": "Груша", "description": "Спелая груша", "price": 80, "quantity": 3},
+                },
+            ],
+        )
+        self.assertEqual(report.merged, [(self.fruits, self.apple)])
+        self.assertEqual((self.apple.quantity, self.apple.price), (15, 60))
+        self.assertEqual(len(report.added), 1)
+        self.assertIs(self.fruits.find_product("Груша"), report.added[0][1])
+        self.assertIs(self.catalog.get_product("Груша"), report.added[0][1])
+        self.assertEqual(self.fruits.total_quantity(), 23)
+
+    def test_price_and_quantity_changes(self):
+        report = apply_delta(
+            [self.fruits],
+            [
+                {"op": "price", "category": "Фрукты", "name": "Апельсин", "price": 65},
+                {"op": "quantity", "category": "Фрукты", "name": "Яблоко", "quantity": 0},
+            ],
+        )
+        self.assertEqual(report.repriced, [(self.fruits, self.orange, 70, 65)])
+        self.assertEqual(report.restocked, [(self.fruits, self.apple, 10, 0)])
+        self.assertEqual(self.fruits.stock_value(), 65 * 5)
+        self.assertEqual(report.changed, 2)
+
+    def test_delete_updates_category_and_catalog(self):
+        report = apply_delta(self.catalog, [{"op": "delete", "category": "Фрукты", "name": "Яблоко"}])
+        self.assertEqual(report.deleted, [(self.fruits, self.apple)])
+        self.assertEqual(list(self.fruits), [self.orange])
+        self.assertIsNone(self.fruits.find_product("Яблоко"))
+        self.assertIsNone(self.catalog.get_product("Яблоко"))
+        self.assertEqual(self.catalog.product_count, 1)
+        self.assertEqual(self.fruits.get_average_price(), 70.0)
+
+    def test_new_category_created(self):
+        report = apply_delta(
+            self.catalog,
+            [{"op": "upsert", "category": "Овощи", "product": {"name": "Морковь", "price": 30, "quantity": 40}}],
+        )
+        self.assertEqual([category.name for category in report.created_categories], ["Овощи"])
+        self.assertIs(self.catalog.category_of("Морковь"), report.created_categories[0])
+
+    def test_rejected_changes(self):
+        report = apply_delta(
+            self.catalog,
+            [
+                {"op": "price", "category": "Фрукты", "name": "Яблоко", "price": -1},
+                {"op": "price", "category": "Фрукты", "name": "Манго", "price": 100},
+                {"op": "delete", "category": "Овощи", "name": "Морковь"},
+                {"op": "rename", "category": "Фрукты", "name": "Яблоко"},
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Слива", "price": 40, "quantity": 0}},
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Яблоко", "quantity": 1}},
+            ],
+        )
+        self.assertEqual(len(report.rejected), 6)
+        self.assertEqual(report.changed, 0)
+        self.assertEqual((self.apple.price, self.apple.quantity), (50, 10))
+        self.assertIn("отклонено: 6", str(report))
+
+    def test_changes_apply_in_feed_order(self):
+        report = apply_delta(
+            self.catalog,
+            [
+                {"op": "delete", "category": "Фрукты", "name": "Апельсин"},
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Апельсин", "price": 75, "quantity": 2}},
+                {"op": "price", "category": "Фрукты", "name": "Апельсин", "price": 99},
+            ],
+        )
+        live = self.fruits.find_product("Апельсин")
+        self.assertIsNot(live, self.orange)
+        self.assertEqual(report.deleted, [(self.fruits, self.orange)])
+        self.assertEqual(report.repriced, [(self.fruits, live, 75, 99)])
+        self.assertEqual((live.price, live.quantity), (99, 2))
+        self.assertIs(self.catalog.get_product("Апельсин"), live)
+
+    def test_upsert_rejects_non_positive_values(self):
+        report = apply_delta(
+            self.catalog,
+            [
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Яблоко", "price": 50, "quantity": -100}},
+                {"op": "upsert", "category": "Фрукты", "product": {"name": "Яблоко", "price": 0, "quantity": 1}},
+            ],
+        )
+        self.assertEqual(len(report.rejected), 2)
+        self.assertEqual(report.merged, [])
+        self.assertEqual((self.apple.price, self.apple.quantity), (50, 10))
+
+    def test_non_numeric_values_rejected(self):
+        report = apply_delta(
+            self.catalog,
+            [
+                {"op": "price", "category": "Фрукты", "name": "Яблоко", "price": "дешево"},
+                {"op": "quantity", "category": "Фрукты", "name": "Яблоко", "quantity": "5"},
+                {"op": "quantity", "category": "Фрукты", "name": "Апельсин", "quantity": 8},
+            ],
+        )
+        self.assertEqual(len(report.rejected), 2)
+        self.assertEqual(report.restocked, [(self.fruits, self.orange, 5, 8)])
+        self.assertEqual((self.apple.price, self.apple.quantity), (50, 10))
+
+    def test_indexes_follow_removal(self):
+        phone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.fruits.add_product(phone)
+        prices = PriceIndex([self.fruits])
+        search = SearchIndex([self.fruits])
+        facets = FacetIndex(self.fruits)
+        apply_delta(self.catalog, [{"op": "delete", "category": "Фрукты", "name": "Iphone 15"}])
+        self.assertEqual(list(prices), [self.apple, self.orange])
+        self.assertEqual(search.search("iphone"), [])
+        self.assertEqual(facets.select(memory=512), [])
+        self.assertEqual(len(facets), 2)
+
+
+class TestCategoryRemoval(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Фрукты", "Разнообразные фрукты", [], columnar=True)
+        self.apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.orange = Product("Апельсин", "Сладкий апельсин", 70, 5)
+        for product in (self.apple, self.orange, self.apple):
+            self.category.add_product(product)
+
+    def test_remove_all_occurrences(self):
+        self.category.remove_product(self.apple)
+        self.assertEqual(list(self.category), [self.orange])
+        self.assertEqual(self.category.total_quantity(), 5)
+        self.apple.quantity = 100
+        self.orange.price = 80
+        self.assertEqual(self.category.stock_value(), 400)
+        self.category.recalculate()
+        self.assertEqual(self.category.stock_value(), 400)
+
+    def test_remove_moves_last_row(self):
+        pear = Product("Груша", "Спелая груша", 80, 3)
+        self.category.add_product(pear)
+        self.category.remove_product(self.orange)
+        self.assertEqual(list(self.category), [self.apple, pear, self.apple])
+        self.assertEqual([list(column) for column in self.category.columns()], [[50, 80, 50], [10, 3, 10]])
+        pear.price = 90
+        self.apple.quantity = 1
+        self.assertEqual([list(column) for column in self.category.columns()], [[50, 90, 50], [1, 3, 1]])
+        self.assertEqual(self.category.stock_value(), 50 + 270 + 50)
+        self.category.remove_products([self.apple, pear])
+        self.assertEqual(len(self.category), 0)
+        self.assertEqual(self.category.total_quantity(), 0)
+
+    def test_remove_missing_product(self):
+        with self.assertRaises(ValueError):
+            self.category.remove_product(Product("Груша", "Спелая груша", 80, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
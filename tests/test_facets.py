@@ -0,0 +1,60 @@
+import unittest
+
+from src.facets import FacetIndex
+from src.products import Category, LawnGrass, Product, Smartphone
+from tests.helpers import CategoryCountersMixin
+
+
+class TestFacetIndex(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Смартфоны", "Высокотехнологичные смартфоны", [])
+        self.samsung = Smartphone(
+            "Samsung Galaxy S23 Ultra", "256GB, Серый цвет", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый"
+        )
+        self.iphone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.xiaomi = Smartphone("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14, 90.3, "Note 11", 1024, "Синий")
+        for product in (self.samsung, self.iphone, self.xiaomi):
+            self.category.add_product(product)
+        self.index = FacetIndex(self.category)
+
+    def test_and_query(self):
+        self.assertEqual(self.index.select(memory=512, color="Gray space"), [self.iphone])
+        self.assertEqual(self.index.select(memory=512, color="Синий"), [])
+        self.assertEqual(self.index.select(), [self.samsung, self.iphone, self.xiaomi])
+
+    def test_or_within_attribute(self):
+        self.assertEqual(self.index.select(memory=[256, 1024]), [self.samsung, self.xiaomi])
+
+    def test_or_across_attributes(self):
+        self.assertEqual(self.index.select_any(memory=512, color="Синий"), [self.iphone, self.xiaomi])
+
+    def test_facet_counts(self):
+        self.assertEqual(self.index.facet_counts("memory"), {256: 1, 512: 1, 1024: 1})
+        self.assertEqual(self.index.facet_counts("color", memory=[512, 1024]), {"Gray space": 1, "Синий": 1})
+        self.assertEqual(self.index.count(color="Серый"), 1)
+
+    def test_incremental_add(self):
+        pixel = Smartphone("Pixel 8", "256GB, Синий", 70000.0, 3, 92.0, "8", 256, "Синий")
+        self.index.select(color="Синий")
+        self.category.add_product(pixel)
+        self.assertEqual(self.index.select(color="Синий"), [self.xiaomi, pixel])
+        self.assertEqual(self.index.facet_counts("memory"), {256: 2, 512: 1, 1024: 1})
+
+    def test_mixed_product_classes(self):
+        category = Category("Сад", "Товары для сада", [])
+        grass = LawnGrass("Газонная трава", "Элитная трава", 500.0, 20, "Россия", "7 дней", "Зеленый")
+        category.add_product(grass)
+        category.add_product(Product("Лейка", "Пластиковая лейка", 300, 5))
+        index = FacetIndex(category)
+        self.assertEqual(index.select(country="Россия", color="Зеленый"), [grass])
+        self.assertEqual(index.count(), 2)
+
+    def test_custom_attributes(self):
+        index = FacetIndex(self.category, attributes=("model",))
+        self.assertEqual(index.select(model="15"), [self.iphone])
+        self.assertEqual(index.select(color="Синий"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
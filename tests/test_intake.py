@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+
+from src.intake import OrderIntake
+from src.orders import OrderEngine, OutOfStockError
+from src.products import Order, Product
+
+
+class TestOrderIntake(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.product = Product("Iphone 15", "512GB, Gray space", 210000.0, 10)
+        self.other = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 5)
+
+    async def test_submit_returns_order(self):
+        async with OrderIntake(max_batch_latency=0.001) as intake:
+            order = await intake.submit(self.product, 3)
+        self.assertIsInstance(order, Order)
+        self.assertEqual(order.total_cost, 630000.0)
+        self.assertEqual(self.product.quantity, 7)
+
+    async def test_burst_is_batched_per_product(self):
+        engine = OrderEngine()
+        async with OrderIntake(engine, max_batch_size=50, max_batch_latency=0.05, workers=1) as intake:
+            results = await asyncio.gather(
+                *(intake.submit(self.product if index % 2 else self.other, 1) for index in range(20)),
+                return_exceptions=True,
+            )
+            stats = intake.stats()
+        rejected = [result for result in results if isinstance(result, OutOfStockError)]
+        self.assertEqual(len(rejected), 5)
+        self.assertEqual(self.product.quantity, 0)
+        self.assertEqual(self.other.quantity, 0)
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["mean_batch_size"], 20)
+        self.assertEqual(engine.placed_count, 15)
+
+    async def test_batch_size_limit(self):
+        async with OrderIntake(max_batch_size=4, max_batch_latency=0.05, workers=1) as intake:
+            await asyncio.gather(*(intake.submit(self.product, 1) for _ in range(8)))
+            stats = intake.stats()
+        self.assertEqual(stats["batches"], 2)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertGreater(stats["max_batch_latency"], 0)
+
+    async def test_invalid_quantity_rejected_individually(self):
+        async with OrderIntake(max_batch_latency=0.01, workers=1) as intake:
+            results = await asyncio.gather(
+                intake.submit(self.product, 0), intake.submit(self.product, 2), return_exceptions=True
+            )
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], Order)
+
+    async def test_cancelled_submit_reserves_nothing(self):
+        engine = OrderEngine()
+        async with OrderIntake(engine, max_batch_latency=0.05, workers=1) as intake:
+            waiting = asyncio.create_task(intake.submit(self.product, 3))
+            await asyncio.sleep(0.01)
+            waiting.cancel()
+            order = await intake.submit(self.product, 1)
+        self.assertTrue(waiting.cancelled())
+        self.assertEqual(order.quantity, 1)
+        self.assertEqual(self.product.quantity, 9)
+        self.assertEqual(engine.placed_count, 1)
+
+    async def test_submit_requires_start(self):
+        with self.assertRaises(RuntimeError):
+            await OrderIntake().submit(self.product, 1)
+
+    async def test_submit_invalid_product(self):
+        async with OrderIntake() as intake:
+            with self.assertRaises(TypeError):
+                await intake.submit("непродукт", 1)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            OrderIntake(max_batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.facets import FacetIndex
+from src.interning import intern_value
+from src.products import Category, LawnGrass, Product, Smartphone
+from src.utils import load_shards
+from tests.helpers import CategoryCountersMixin
+
+
+def fresh(text):
+    """Новая строка с тем же содержимым, как после разбора JSON."""
+    return json.loads(json.dumps(text))
+
+
+class TestInterning(CategoryCountersMixin, unittest.TestCase):
+    def test_intern_value(self):
+        first, second = fresh("Серый цвет"), fresh("Серый цвет")
+        self.assertIsNot(first, second)
+        self.assertIs(intern_value(first), intern_value(second))
+        self.assertEqual(intern_value(256), 256)
+        self.assertIsNone(intern_value(None))
+
+    def test_shared_attributes(self):
+        phones = [
+            Smartphone(f"Телефон {index}", fresh("256GB, Серый"), 1000.0, 1, 90.0, fresh("S23"), 256, fresh("Серый"))
+            for index in range(2)
+        ]
+        grass = [
+            LawnGrass(
+                f"Трава {index}", fresh("Для газона"), 500.0, 1, fresh("Россия"), fresh("7 дней"), fresh("Зеленый")
+            )
+            for index in range(2)
+        ]
+        for attribute in ("description", "model", "color"):
+            self.assertIs(getattr(phones[0], attribute), getattr(phones[1], attribute))
+        for attribute in ("description", "country", "germination_period", "color"):
+            self.assertIs(getattr(grass[0], attribute), getattr(grass[1], attribute))
+
+        restored = Product.restore("Трава", fresh("Для газона"), 500.0, 0)
+        self.assertIs(restored.description, grass[0].description)
+
+    def test_bulk_load(self):
+        catalog = [
+            {
+                "name": "Трава",
+                "description": "Газонная трава",
+                "products": [
+                    {"name": f"Трава {index}", "description": "Для газона", "price": 500.0, "quantity": 1}
+                    for index in range(3)
+                ],
+            }
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.json")
+            with open(path, "w", encoding="UTF-8") as file:
+                json.dump(catalog, file, ensure_ascii=False)
+            category = load_shards([path])[0]
+        descriptions = {id(product.description) for product in category}
+        self.assertEqual(len(descriptions), 1)
+
+    def test_facet_filter_with_fresh_value(self):
+        category = Category("Смартфоны", "Смартфоны", [])
+        phone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        category.add_product(phone)
+        index = FacetIndex(category)
+        self.assertEqual(index.select(color=fresh("Gray space")), [phone])
+
+
+if __name__ == "__main__":
+    unittest.main()
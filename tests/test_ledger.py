@@ -0,0 +1,140 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.ledger import RECORD, LedgerReader, OrderLedger, product_id
+from src.orders import OrderEngine
+from src.products import Order, Product
+
+
+class TestOrderLedger(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "orders.ledger")
+        self.iphone = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+        self.xiaomi = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_product_id_is_stable(self):
+        self.assertEqual(product_id(self.iphone), product_id("Iphone 15"))
+        self.assertNotEqual(product_id(self.iphone), product_id(self.xiaomi))
+
+    def test_group_commit(self):
+        ledger = OrderLedger(self.path, batch_size=2, durable=False)
+        ledger.append(Order(self.iphone, 1), timestamp=1.0)
+        self.assertEqual(ledger.pending, 1)
+        with LedgerReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+        ledger.append(Order(self.xiaomi, 2), timestamp=2.0)
+        self.assertEqual(ledger.pending, 0)
+        ledger.append(Order(self.xiaomi, 1), timestamp=3.0)
+        ledger.close()
+        with LedgerReader(self.path) as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertEqual(reader[0], (1.0, product_id(self.iphone), 1, 210000.0, 210000.0))
+            self.assertEqual(reader[-1][2], 1)
+
+    def test_aggregation_and_replay(self):
+        with OrderLedger(self.path, durable=False) as ledger:
+            ledger.append(Order(self.iphone, 2), timestamp=10.0)
+            ledger.append(Order(self.xiaomi, 4), timestamp=20.0)
+            ledger.append_cancel(Order(self.xiaomi, 1), timestamp=30.0)
+        # Новый запуск дописывает в тот же журнал
+        with OrderLedger(self.path, durable=False) as ledger:
+            ledger.append(Order(self.iphone, 1), timestamp=40.0)
+
+        with LedgerReader(self.path) as reader:
+            self.assertEqual(len(reader), 4)
+            self.assertEqual(reader.revenue(), 3 * 210000.0 + 3 * 31000.0)
+            self.assertEqual(reader.revenue(start=15, end=40), 3 * 31000.0)
+            totals = reader.totals_by_product()
+            self.assertEqual(totals[product_id(self.iphone)], [3, 630000.0])
+            self.assertEqual(totals[product_id(self.xiaomi)], [3, 93000.0])
+
+            fresh_iphone = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+            fresh_xiaomi = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+            sold = reader.replay([fresh_iphone, fresh_xiaomi])
+        self.assertEqual((fresh_iphone.quantity, fresh_xiaomi.quantity), (5, 11))
+        self.assertEqual(sold[fresh_iphone], 3)
+
+    def test_truncated_tail_and_bad_file(self):
+        with OrderLedger(self.path, durable=False) as ledger:
+            ledger.append(Order(self.iphone, 1), timestamp=1.0)
+        with open(self.path, "ab") as file:
+            file.write(b"\0" * (RECORD.size // 2))
+        with OrderLedger(self.path, durable=False) as ledger:
+            ledger.append(Order(self.iphone, 1), timestamp=2.0)
+        with LedgerReader(self.path) as reader:
+            self.assertEqual([record[0] for record in reader], [1.0, 2.0])
+
+        other = os.path.join(self.directory.name, "other.bin")
+        with open(other, "wb") as file:
+            file.write(b"not a ledger at all")
+        with self.assertRaises(ValueError):
+            LedgerReader(other)
+        with self.assertRaises(ValueError):
+            OrderLedger(other)
+        with open(other, "rb") as file:
+            self.assertEqual(file.read(), b"not a ledger at all")
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "нужен /proc/self/fd")
+    def test_bad_file_does_not_leak_descriptors(self):
+        other = os.path.join(self.directory.name, "other.bin")
+        with open(other, "wb") as file:
+            file.write(b"not a ledger at all")
+        before = len(os.listdir("/proc/self/fd"))
+        errors = []  # Трассировки держат недостроенные объекты, как это было бы у вызывающего кода
+        for opener in (LedgerReader, OrderLedger):
+            try:
+                opener(other)
+            except ValueError as error:
+                errors.append(error)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(len(os.listdir("/proc/self/fd")), before)
+
+    def test_engine_writes_ledger(self):
+        with OrderLedger(self.path, batch_size=16, durable=False) as ledger:
+            engine = OrderEngine(stripes=4, ledger=ledger)
+            threads = [threading.Thread(target=engine.place, args=(self.xiaomi, 1)) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            engine.place_batch(self.iphone, [3, 10, 2])
+            order = engine.place(self.iphone, 1)
+            engine.cancel(order)
+
+        with LedgerReader(self.path) as reader:
+            self.assertEqual(len(reader), 14)
+            totals = reader.totals_by_product()
+        self.assertEqual(totals[product_id(self.xiaomi)][0], 10)
+        self.assertEqual(totals[product_id(self.iphone)][0], 5)
+        self.assertEqual((self.xiaomi.quantity, self.iphone.quantity), (4, 3))
+
+    def test_fractional_quantity(self):
+        cheese = Product("Сыр", "Весовой", 1000.0, 5.0)
+        with OrderLedger(self.path, durable=False) as ledger:
+            OrderEngine(ledger=ledger).place(cheese, 1.5)
+        with LedgerReader(self.path) as reader:
+            self.assertEqual(reader[0][2:], (1.5, 1000.0, 1500.0))
+            restored = Product("Сыр", "Весовой", 1000.0, 5.0)
+            reader.replay([restored])
+        self.assertEqual((cheese.quantity, restored.quantity), (3.5, 3.5))
+
+    def test_failed_ledger_write_releases_stock(self):
+        ledger = OrderLedger(self.path, batch_size=1, durable=False)
+        engine = OrderEngine(ledger=ledger)
+        ledger.close()
+        with self.assertRaises(ValueError):
+            engine.place(self.iphone, 3)
+        results = engine.place_batch(self.iphone, [2, 1])
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(self.iphone.quantity, 8)
+        self.assertEqual((engine.placed_count, engine.rejected_count), (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import os
+import threading
+import unittest
+from contextlib import redirect_stdout
+
+from src import utils
+from src.metrics import disable_metrics, enable_metrics, metrics_enabled, metrics_snapshot, reset_metrics
+from src.products import Category, Order, Product
+from tests.helpers import CategoryCountersMixin
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "products.json")
+
+
+class TestMetrics(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        reset_metrics()
+        enable_metrics()
+        self.addCleanup(disable_metrics)
+        self.addCleanup(reset_metrics)
+        self.category = Category("Фрукты", "Разнообразные фрукты", [])
+
+    def test_disabled_restores_originals(self):
+        add_product = Category.add_product
+        disable_metrics()
+        self.assertFalse(metrics_enabled())
+        self.assertIsNot(Category.add_product, add_product)
+        self.assertFalse(hasattr(Category.add_product, "__wrapped__"))
+        Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.assertEqual(metrics_snapshot(), {})
+
+    def test_counts_calls_and_rejections(self):
+        apple = Product.new_product({"name": "Яблоко", "description": "Сочное яблоко", "price": 50, "quantity": 10})
+        self.category.add_product(apple)
+        with self.assertRaises(TypeError):
+            self.category.add_product("непродукт")
+        with redirect_stdout(io.StringIO()):
+            apple.price = -1
+        apple.price = 60
+        Order(apple, 2)
+        with self.assertRaises(TypeError):
+            Order("непродукт", 1)
+
+        snapshot = metrics_snapshot()
+        self.assertEqual(snapshot["Category.add_product"]["calls"], 2)
+        self.assertEqual(snapshot["Category.add_product"]["rejections"], 1)
+        self.assertEqual(snapshot["Product.new_product"]["calls"], 1)
+        # Установка цены в конструкторе учитывается в создании товара, а не в сеттере
+        self.assertEqual(snapshot["Product"]["calls"], 1)
+        self.assertEqual(snapshot["Product.price"]["calls"], 2)
+        self.assertEqual(snapshot["Product.price"]["rejections"], 1)
+        self.assertEqual(snapshot["Order"]["rejections"], 1)
+        stat = snapshot["Category.add_product"]
+        self.assertLessEqual(stat["p50_seconds"], stat["p99_seconds"])
+        self.assertLessEqual(stat["p99_seconds"], stat["max_seconds"])
+
+    def test_loaders_instrumented(self):
+        utils.load_json(DATA_PATH)
+        categories = utils.load_categories(DATA_PATH)
+        for category in utils.iter_categories(DATA_PATH):
+            break
+        utils.load_shards([DATA_PATH])
+        with self.assertRaises(OSError):
+            utils.load_categories(os.path.join(os.path.dirname(DATA_PATH), "missing.json"))
+
+        snapshot = metrics_snapshot()
+        self.assertEqual(snapshot["load_json"]["calls"], 1)
+        self.assertEqual(snapshot["load_categories"]["calls"], 2)
+        self.assertEqual(snapshot["load_categories"]["rejections"], 1)
+        # load_categories перебирает iter_categories, плюс один прерванный перебор выше
+        self.assertEqual(snapshot["iter_categories"]["calls"], 3)
+        self.assertEqual(snapshot["iter_categories"]["rejections"], 1)
+        self.assertEqual(snapshot["load_shards"]["calls"], 1)
+        self.assertGreaterEqual(snapshot["Product"]["calls"], 2 * sum(len(category) for category in categories))
+        self.assertNotIn("Product.price", snapshot)
+
+    def test_thread_safe(self):
+        def worker():
+            for _ in range(500):
+                Product("Яблоко", "Сочное яблоко", 50, 10)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(metrics_snapshot()["Product"]["calls"], 2000)
+
+    def test_enable_is_idempotent(self):
+        enable_metrics()
+        Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.assertEqual(metrics_snapshot()["Product"]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import threading
+import unittest
+
+from src.orders import OrderEngine, OutOfStockError
+from src.products import Category, Order, Product
+from tests.helpers import CategoryCountersMixin
+
+
+class TestOrderEngine(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.engine = OrderEngine(stripes=4)
+        self.product = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+
+    def test_place_reserves_stock(self):
+        order = self.engine.place(self.product, 3)
+        self.assertIsInstance(order, Order)
+        self.assertEqual(order.total_cost, 630000.0)
+        self.assertEqual(self.product.quantity, 5)
+        self.assertEqual(self.engine.placed_count, 1)
+
+    def test_reject_when_stock_short(self):
+        with self.assertRaises(OutOfStockError):
+            self.engine.place(self.product, 9)
+        self.assertEqual(self.product.quantity, 8)
+        self.assertEqual(self.engine.rejected_count, 1)
+
+    def test_sell_out_exactly(self):
+        self.engine.place(self.product, 8)
+        self.assertEqual(self.product.quantity, 0)
+        with self.assertRaises(OutOfStockError):
+            self.engine.place(self.product, 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            self.engine.place("непродукт", 1)
+        with self.assertRaises(ValueError):
+            self.engine.place(self.product, 0)
+        with self.assertRaises(ValueError):
+            OrderEngine(stripes=0)
+
+    def test_cancel_returns_stock(self):
+        order = self.engine.place(self.product, 2)
+        self.engine.cancel(order)
+        self.assertEqual(self.product.quantity, 8)
+
+    def test_concurrent_orders_never_oversell(self):
+        category = Category("Смартфоны", "Категория смартфонов", [])
+        products = [Product(f"Телефон {index}", "Смартфон", 1000, 50) for index in range(3)]
+        for product in products:
+            category.add_product(product)
+        sold = []
+
+        def worker():
+            for attempt in range(100):
+                try:
+                    sold.append(self.engine.place(products[attempt % 3], 1).quantity)
+                except OutOfStockError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(sold), 150)
+        self.assertEqual([product.quantity for product in products], [0, 0, 0])
+        self.assertEqual(category.total_quantity(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from src.price_index import PriceIndex
+from src.products import Category, Product
+from tests.helpers import CategoryCountersMixin
+
+
+class TestPriceIndex(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.phones = Category("Смартфоны", "Категория смартфонов", [])
+        self.tvs = Category("Телевизоры", "Современные телевизоры", [])
+        self.samsung = Product("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5)
+        self.iphone = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+        self.xiaomi = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+        self.tv = Product('55" QLED 4K', "Фоновая подсветка", 123000.0, 7)
+        for product in (self.samsung, self.iphone, self.xiaomi):
+            self.phones.add_product(product)
+        self.index = PriceIndex([self.phones, self.tvs])
+        self.tvs.add_product(self.tv)
+
+    def test_sorted_order(self):
+        self.assertEqual(list(self.index), [self.xiaomi, self.tv, self.samsung, self.iphone])
+        self.assertEqual(len(self.index), 4)
+
+    def test_many_products_across_blocks(self):
+        prices = [float((index * 7919) % 3001 + 1) for index in range(3000)]
+        category = Category("Склад", "Много товаров", [])
+        category.add_products([Product(f"Товар {i}", "Описание", price, 1) for i, price in enumerate(prices)])
+        index = PriceIndex([category])
+        self.assertEqual([product.price for product in index], sorted(prices))
+        products = list(category)
+        for product in products[::3]:
+            product.price = product.price + 1500.5
+        category.remove_products(products[1::5])
+        expected = sorted(product.price for product in category)
+        self.assertEqual([product.price for product in index], expected)
+        self.assertEqual(len(index), len(expected))
+        self.assertEqual([p.price for p in index.between(100, 900)], [p for p in expected if 100 <= p <= 900])
+        self.assertEqual([p.price for p in index.cheapest(700)], expected[:700])
+        self.assertEqual([p.price for p in index.most_expensive(700)], expected[::-1][:700])
+        self.assertEqual(index.nearest(2000.2).price, min(expected, key=lambda price: (abs(price - 2000.2), price)))
+
+    def test_between(self):
+        self.assertEqual(self.index.between(100000, 180000), [self.tv, self.samsung])
+        self.assertEqual(self.index.between(31000.0, 31000.0), [self.xiaomi])
+        self.assertEqual(self.index.between(1, 10), [])
+
+    def test_cheapest_and_most_expensive(self):
+        self.assertEqual(self.index.cheapest(2), [self.xiaomi, self.tv])
+        self.assertEqual(self.index.most_expensive(2), [self.iphone, self.samsung])
+        self.assertEqual(self.index.cheapest(0), [])
+        self.assertEqual(self.index.most_expensive(0), [])
+
+    def test_nearest(self):
+        self.assertIs(self.index.nearest(130000), self.tv)
+        self.assertIs(self.index.nearest(1), self.xiaomi)
+        self.assertIs(self.index.nearest(10**6), self.iphone)
+        self.assertIsNone(PriceIndex().nearest(100))
+
+    def test_reprice_moves_product(self):
+        self.iphone.price = 20000.0
+        self.assertEqual(self.index.cheapest(1), [self.iphone])
+        self.assertEqual(self.index.between(200000, 300000), [])
+
+    def test_invalid_price_ignored(self):
+        self.iphone.price = -1
+        self.assertEqual(self.index.most_expensive(1), [self.iphone])
+
+    def test_same_product_indexed_once(self):
+        self.tvs.add_product(self.iphone)
+        self.assertEqual(len(self.index), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from src.products import Product, ProductIndex
+
+
+class TestProductIndex(unittest.TestCase):
+    def setUp(self):
+        self.product = Product("Телевизор", "4K LED экран", 30000, 15)
+        self.index = ProductIndex([self.product])
+
+    def test_lookup_by_name(self):
+        self.assertIs(self.index["Телевизор"], self.product)
+        self.assertIn("Телевизор", self.index)
+        self.assertIsNone(self.index.get("Утюг"))
+        self.assertEqual(len(self.index), 1)
+
+    def test_add_invalid_product(self):
+        with self.assertRaises(TypeError):
+            self.index.add("непродукт")
+
+    def test_first_product_wins_on_duplicate_name(self):
+        duplicate = Product("Телевизор", "Другой экран", 10000, 1)
+        self.assertIs(self.index.add(duplicate), self.product)
+        self.assertEqual(self.product.quantity, 15)
+
+    def test_new_product_merges_into_index(self):
+        product_info = {"name": "Телевизор", "description": "4K LED экран", "price": 35000, "quantity": 5}
+        updated = Product.new_product(product_info, self.index)
+        self.assertIs(updated, self.product)
+        self.assertEqual(updated.quantity, 20)
+        self.assertEqual(updated.price, 35000)
+
+    def test_new_product_keeps_max_price(self):
+        product_info = {"name": "Телевизор", "description": "4K LED экран", "price": 25000, "quantity": 1}
+        updated = Product.new_product(product_info, self.index)
+        self.assertEqual(updated.price, 30000)
+
+    def test_new_product_registers_created(self):
+        product_info = {"name": "Микроволновка", "description": "СВЧ печь", "price": 8000, "quantity": 3}
+        created = Product.new_product(product_info, self.index)
+        self.assertIs(self.index["Микроволновка"], created)
+
+
+class TestNewProducts(unittest.TestCase):
+    def test_batch_merge(self):
+        batch = [
+            {"name": "Яблоко", "description": "Сочное яблоко", "price": 50, "quantity": 10},
+            {"name": "Апельсин", "description": "Сладкий апельсин", "price": 70, "quantity": 5},
+            {"name": "Яблоко", "description": "Сочное яблоко", "price": 60, "quantity": 5},
+        ]
+        index = Product.new_products(batch)
+        self.assertEqual([p.name for p in index], ["Яблоко", "Апельсин"])
+        self.assertEqual(index["Яблоко"].quantity, 15)
+        self.assertEqual(index["Яблоко"].price, 60)
+
+    def test_batch_merge_into_existing_list(self):
+        apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        index = Product.new_products([{"name": "Яблоко", "description": "", "price": 40, "quantity": 2}], [apple])
+        self.assertIs(index["Яблоко"], apple)
+        self.assertEqual(apple.quantity, 12)
+        self.assertEqual(apple.price, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from src.facets import FacetIndex
+from src.price_index import PriceIndex
+from src.products import Category, Product, Smartphone
+from src.query import Query
+from src.search import SearchIndex
+from tests.helpers import CategoryCountersMixin
+
+
+class TestQuery(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Смартфоны", "Высокотехнологичные смартфоны", [])
+        self.samsung = Smartphone(
+            "Samsung Galaxy S23 Ultra", "256GB, Серый цвет", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый"
+        )
+        self.iphone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.xiaomi = Smartphone("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14, 90.3, "Note 11", 1024, "Синий")
+        self.nokia = Smartphone("Nokia 3310", "Кнопочный, Синий", 5000.0, 3, 10.0, "3310", 1, "Синий")
+        for product in (self.samsung, self.iphone, self.xiaomi, self.nokia):
+            self.category.add_product(product)
+
+    def check_queries(self):
+        query = self.category.query()
+        self.assertIsInstance(query, Query)
+        self.assertEqual(query.all(), [self.samsung, self.iphone, self.xiaomi, self.nokia])
+        self.assertEqual(query.where(color="Синий").all(), [self.xiaomi, self.nokia])
+        self.assertEqual(query.where(memory=[256, 512]).all(), [self.samsung, self.iphone])
+        self.assertEqual(query.where(color="Синий", model="3310").all(), [self.nokia])
+        self.assertEqual(query.price_between(30000, 200000).order_by("price").all(), [self.xiaomi, self.samsung])
+        self.assertEqual(query.price_between(30000, 200000).order_by("-price").all(), [self.samsung, self.xiaomi])
+        self.assertEqual(query.search("сини").order_by("price").all(), [self.nokia, self.xiaomi])
+        self.assertEqual(query.search("gray sp").all(), [self.iphone])
+        self.assertEqual(query.where(lambda product: product.quantity > 5).count(), 2)
+        self.assertEqual(query.order_by("-price").limit(2).all(), [self.iphone, self.samsung])
+        self.assertEqual(query.order_by("price").offset(1).limit(2).all(), [self.xiaomi, self.samsung])
+        self.assertEqual(query.order_by(lambda product: product.name).first(), self.iphone)
+        self.assertIsNone(query.where(color="Красный").first())
+
+    def test_without_indexes(self):
+        self.check_queries()
+
+    def test_with_indexes(self):
+        FacetIndex(self.category)
+        PriceIndex([self.category])
+        SearchIndex([self.category])
+        self.check_queries()
+
+    def test_builder_is_immutable(self):
+        query = self.category.query()
+        cheap = query.price_between(0, 50000)
+        self.assertEqual(query.count(), 4)
+        self.assertEqual(cheap.count(), 2)
+        self.assertEqual(cheap.where(color="Синий").limit(1).all(), [self.xiaomi])
+
+    def test_lazy_evaluation(self):
+        seen = []
+
+        def predicate(product):
+            seen.append(product)
+            return True
+
+        query = self.category.query().where(predicate)
+        self.assertEqual(seen, [])
+        self.assertEqual(query.first(), self.samsung)
+        self.assertEqual(seen, [self.samsung])
+
+    def test_sees_later_changes(self):
+        index = PriceIndex([self.category])
+        query = self.category.query().price_between(0, 10000)
+        self.assertEqual(query.all(), [self.nokia])
+        phone = Product("Телефон", "Простой телефон", 7000.0, 2)
+        self.category.add_product(phone)
+        self.xiaomi.price = 9000.0
+        self.assertEqual(query.order_by("price").all(), [self.nokia, phone, self.xiaomi])
+        self.category.remove_products([phone])
+        self.assertEqual(query.all(), [self.nokia, self.xiaomi])
+        self.assertEqual(len(index), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
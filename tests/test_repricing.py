@@ -0,0 +1,62 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.products import Category, Product
+from src.repricing import RejectDecreases, ThresholdPolicy, reprice
+from tests.helpers import CategoryCountersMixin
+
+
+class TestReprice(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category("Фрукты", "Разнообразные фрукты", [])
+        self.apple = Product("Яблоко", "Сочное яблоко", 50, 10)
+        self.orange = Product("Апельсин", "Сладкий апельсин", 70, 5)
+        self.pear = Product("Груша", "Спелая груша", 80, 3)
+        for product in (self.apple, self.orange, self.pear):
+            self.category.add_product(product)
+
+    def test_percent_discount(self):
+        report = reprice(self.category, percent=-10)
+        self.assertEqual([product.price for product in self.category], [45, 63, 72])
+        self.assertEqual(len(report.applied), 3)
+        self.assertEqual(self.category.get_average_price(), 60.0)
+
+    def test_absolute_change_with_filter(self):
+        report = reprice(self.category, amount=5, where=lambda product: product.price > 60)
+        self.assertEqual([product.price for product in self.category], [50, 75, 85])
+        self.assertEqual(report.applied, [(self.orange, 70, 75), (self.pear, 80, 85)])
+
+    def test_reject_decreases(self):
+        report = reprice([self.apple], percent=-20, policy=RejectDecreases())
+        self.assertEqual(self.apple.price, 50)
+        self.assertEqual(len(report.rejected), 1)
+        self.assertEqual(report.rejected[0][:3], (self.apple, 50, 40))
+
+    def test_threshold_policy(self):
+        policy = ThresholdPolicy(0.3)
+        report = reprice(self.category, amount=-20, policy=policy)
+        self.assertEqual([product.price for product in self.category], [50, 70 - 20, 80 - 20])
+        self.assertEqual([row[0] for row in report.rejected], [self.apple])
+        self.assertEqual(str(report), "Переоценено: 2, отклонено: 1")
+
+    def test_invalid_price_rejected_silently(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            report = reprice(self.category, amount=-60)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual([row[0] for row in report.rejected], [self.apple])
+        self.assertEqual(self.apple.price, 50)
+
+    def test_change_required(self):
+        with self.assertRaises(ValueError):
+            reprice(self.category)
+        with self.assertRaises(ValueError):
+            reprice(self.category, percent=5, amount=5)
+        with self.assertRaises(ValueError):
+            ThresholdPolicy(1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import unittest
+
+from src.products import Product
+from src.search import SearchIndex, tokenize
+from src.utils import iter_categories
+from tests.helpers import CategoryCountersMixin
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "products.json")
+
+
+class TestTokenize(unittest.TestCase):
+    def test_mixed_text(self):
+        self.assertEqual(
+            tokenize("256GB, Серый цвет, 200MP камера"),
+            ["256gb", "256", "gb", "серый", "цвет", "200mp", "200", "mp", "камера"],
+        )
+
+    def test_yo_normalized(self):
+        self.assertEqual(tokenize("Зелёный"), ["зеленый"])
+
+
+class TestSearchIndex(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.categories = list(iter_categories(DATA_PATH))
+        self.index = SearchIndex(self.categories)
+
+    def names(self, query, **kwargs):
+        return [product.name for product in self.index.search(query, **kwargs)]
+
+    def test_search_description(self):
+        self.assertEqual(self.names("200MP камера"), ["Samsung Galaxy C23 Ultra"])
+        self.assertEqual(self.names("Gray space"), ["Iphone 15"])
+        self.assertEqual(self.names("256GB"), ["Samsung Galaxy C23 Ultra"])
+
+    def test_prefix_search(self):
+        self.assertEqual(self.names("сер"), ["Samsung Galaxy C23 Ultra"])
+        self.assertEqual(self.names("сер", prefix=False), [])
+        self.assertEqual(self.names("xiao"), ["Xiaomi Redmi Note 11"])
+
+    def test_all_words_required(self):
+        self.assertEqual(self.names("Iphone Синий"), [])
+
+    def test_name_ranked_above_description(self):
+        phones = self.categories[0]
+        phones.add_product(Product("Чехол Iphone", "Силиконовый", 1000, 3))
+        phones.add_product(Product("Пленка", "Защитная пленка для Iphone", 500, 3))
+        self.assertEqual(self.names("iphone"), ["Iphone 15", "Чехол Iphone", "Пленка"])
+        self.assertEqual(self.names("iphone", limit=1), ["Iphone 15"])
+
+    def test_incremental_add(self):
+        self.categories[1].add_product(Product("Телевизор OLED", "Глубокий черный цвет", 150000.0, 2))
+        self.assertEqual(self.names("oled"), ["Телевизор OLED"])
+        self.assertEqual(len(self.index), 5)
+
+    def test_empty_query(self):
+        self.assertEqual(self.index.search("  ,. "), [])
+
+    def test_complete(self):
+        self.assertEqual(self.index.complete("ка"), ["камера"])
+        self.assertEqual(self.index.complete(""), [])
+
+    def test_complete_after_changes(self):
+        phones = self.categories[0]
+        case = Product("Камуфляжный чехол", "Кармашек для карты", 900.0, 4)
+        phones.add_product(case)
+        self.assertEqual(self.index.complete("ка"), ["камера", "камуфляжный", "кармашек", "карты"])
+        phones.remove_products([case])
+        self.assertEqual(self.index.complete("ка"), ["камера"])
+
+
+if __name__ == "__main__":
+    unittest.main()
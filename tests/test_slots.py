@@ -0,0 +1,37 @@
+import unittest
+
+from src.products import BaseProduct, LawnGrass, Product, Smartphone
+
+
+class TestSlottedProducts(unittest.TestCase):
+    def setUp(self):
+        self.product = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+        self.smartphone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.grass = LawnGrass("Газонная трава", "Элитная трава", 500.0, 20, "Россия", "7 дней", "Зеленый")
+
+    def test_no_instance_dict(self):
+        for product in (self.product, self.smartphone, self.grass):
+            self.assertFalse(hasattr(product, "__dict__"))
+
+    def test_unknown_attribute_rejected(self):
+        with self.assertRaises(AttributeError):
+            self.product.weight = 10
+
+    def test_price_validation_kept(self):
+        self.smartphone.price = -1
+        self.assertEqual(self.smartphone.price, 210000.0)
+        self.smartphone.price = 200000.0
+        self.assertEqual(self.smartphone.price, 200000.0)
+
+    def test_abstract_contract_kept(self):
+        self.assertIsInstance(self.grass, BaseProduct)
+        with self.assertRaises(TypeError):
+            BaseProduct("Товар", "Описание", 100, 1)
+
+    def test_lawn_grass_length_default(self):
+        self.assertIsNone(self.grass.length)
+        self.assertEqual(self.grass.color, "Зеленый")
+
+
+if __name__ == "__main__":
+    unittest.main()
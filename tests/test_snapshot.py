@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from src.products import Category, LawnGrass, Product, Smartphone
+from src.snapshot import Snapshot, write_snapshot
+from tests.helpers import CategoryCountersMixin
+
+
+class TestSnapshot(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.phones = Category("Смартфоны", "Высокотехнологичные смартфоны", [])
+        self.phones.add_product(
+            Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        )
+        self.phones.add_product(Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14))
+        self.garden = Category("Газонная трава", "Различные виды газонной травы", [])
+        self.garden.add_product(LawnGrass("Газонная трава", "Элитная трава", 500.0, 20, "Россия", "7 дней", "Зеленый"))
+        self.empty = Category("Пустая категория", "Категория без продуктов", [])
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "catalog.snap")
+        write_snapshot(self.path, [self.phones, self.garden, self.empty])
+        self.snapshot = Snapshot(self.path)
+        self.addCleanup(self.snapshot.close)
+
+    def test_categories(self):
+        categories = self.snapshot.categories()
+        self.assertEqual(
+            [category.name for category in categories], ["Смартфоны", "Газонная трава", "Пустая категория"]
+        )
+        self.assertEqual([len(category) for category in categories], [2, 1, 0])
+        self.assertEqual(len(self.snapshot), 3)
+
+    def test_aggregates_from_columns(self):
+        phones = self.snapshot.categories()[0]
+        self.assertEqual(phones.get_average_price(), self.phones.get_average_price())
+        self.assertEqual(phones.total_quantity(), 22)
+        self.assertEqual(phones.stock_value(), self.phones.stock_value())
+        self.assertEqual(str(phones), str(self.phones))
+        self.assertEqual(self.snapshot.categories()[2].get_average_price(), 0.0)
+
+    def test_lazy_products(self):
+        phones = self.snapshot.categories()[0]
+        iphone = phones[0]
+        self.assertIs(type(iphone), Smartphone)
+        self.assertEqual((iphone.name, iphone.price, iphone.quantity), ("Iphone 15", 210000.0, 8))
+        self.assertEqual(
+            (iphone.efficiency, iphone.model, iphone.memory, iphone.color), (98.2, "15", 512, "Gray space")
+        )
+        self.assertIs(phones[0], iphone)
+        self.assertEqual(phones[-1].name, "Xiaomi Redmi Note 11")
+        with self.assertRaises(IndexError):
+            phones[2]
+
+    def test_restored_product_behaves_normally(self):
+        grass = self.snapshot.categories()[1][0]
+        self.assertIs(type(grass), LawnGrass)
+        self.assertEqual(grass.country, "Россия")
+        grass.price = -1
+        self.assertEqual(grass.price, 500.0)
+
+    def test_to_category(self):
+        category = self.snapshot.categories()[0].to_category()
+        self.assertEqual([product.name for product in category], [product.name for product in self.phones])
+        self.assertEqual(category.total_quantity(), 22)
+
+    def test_zero_quantity_survives(self):
+        self.phones.add_product(Product("Распродано", "Нет в наличии", 100.0, 1))
+        list(self.phones)[-1].quantity = 0
+        write_snapshot(self.path + ".2", [self.phones])
+        with Snapshot(self.path + ".2") as snapshot:
+            self.assertEqual(snapshot.categories()[0][2].quantity, 0)
+
+    def test_fractional_quantity(self):
+        self.garden.add_product(Product("Семена", "Развесные", 2000.0, 2.5))
+        write_snapshot(self.path + ".2", [self.phones, self.garden])
+        with Snapshot(self.path + ".2") as snapshot:
+            phones, garden = snapshot.categories()
+            self.assertEqual(snapshot.quantities.format, "d")
+            self.assertEqual([product.quantity for product in garden], [20, 2.5])
+            self.assertIs(type(phones[0].quantity), int)
+            self.assertEqual(garden.total_quantity(), 22.5)
+            self.assertEqual(garden.stock_value(), 500.0 * 20 + 2000.0 * 2.5)
+
+    def test_rewrite_keeps_open_snapshot_readable(self):
+        phones = self.snapshot.categories()[0]
+        write_snapshot(self.path, [self.garden])
+        self.assertEqual(phones[1].name, "Xiaomi Redmi Note 11")
+        self.assertEqual(phones.stock_value(), 210000.0 * 8 + 31000.0 * 14)
+        with Snapshot(self.path) as rewritten:
+            self.assertEqual([category.name for category in rewritten.categories()], ["Газонная трава"])
+        self.assertEqual([name for name in os.listdir(os.path.dirname(self.path))], ["catalog.snap"])
+
+    def test_not_a_snapshot(self):
+        with open(self.path + ".bad", "wb") as file:
+            file.write(b"\0" * 200)
+        with self.assertRaises(ValueError):
+            Snapshot(self.path + ".bad")
+
+
+if __name__ == "__main__":
+    unittest.main()
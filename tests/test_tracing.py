@@ -0,0 +1,86 @@
+import io
+import logging
+import unittest
+from contextlib import redirect_stdout
+
+from src.products import CreationInfoMixin, LawnGrass, Product, Smartphone
+from src.tracing import LoggingTracer, PrintTracer, RingBufferTracer, SampledTracer
+
+
+class TestCreationTracing(unittest.TestCase):
+    def setUp(self):
+        for cls in (Product, Smartphone, LawnGrass):
+            self.addCleanup(self.reset_tracer, cls)
+
+    @staticmethod
+    def reset_tracer(cls):
+        if "creation_tracer" in vars(cls):
+            delattr(cls, "creation_tracer")
+
+    def make_smartphone(self):
+        return Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CreationInfoMixin.creation_tracer)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Product("Телевизор", "4K LED экран", 30000, 15)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_print_tracer(self):
+        Product.set_creation_tracer(PrintTracer())
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Product("Телевизор", "4K LED экран", 30000, 15)
+        self.assertEqual(
+            output.getvalue(),
+            "Создан объект класса Product с параметрами: ('Телевизор', '4K LED экран', 30000, 15), {}\n",
+        )
+
+    def test_ring_buffer_keeps_last_records(self):
+        tracer = RingBufferTracer(capacity=2)
+        Product.set_creation_tracer(tracer)
+        for quantity in (1, 2, 3):
+            Product("Телевизор", "4K LED экран", 30000, quantity)
+        self.assertEqual(len(tracer), 2)
+        self.assertTrue(tracer.records()[-1].endswith("('Телевизор', '4K LED экран', 30000, 3), {}"))
+        tracer.clear()
+        self.assertEqual(tracer.records(), [])
+
+    def test_per_class_switch(self):
+        tracer = RingBufferTracer()
+        Smartphone.set_creation_tracer(tracer)
+        Product("Телевизор", "4K LED экран", 30000, 15)
+        self.make_smartphone()
+        self.assertEqual(len(tracer), 1)
+        self.assertTrue(tracer.records()[0].startswith("Создан объект класса Smartphone"))
+
+    def test_subclass_can_opt_out(self):
+        tracer = RingBufferTracer()
+        Product.set_creation_tracer(tracer)
+        Smartphone.set_creation_tracer(None)
+        self.make_smartphone()
+        LawnGrass("Газонная трава", "Элитная трава", 500.0, 20, "Россия", "7 дней", "Зеленый")
+        self.assertEqual(len(tracer), 1)
+
+    def test_sampled_tracer(self):
+        tracer = RingBufferTracer()
+        Product.set_creation_tracer(SampledTracer(tracer, every=3))
+        for quantity in range(1, 8):
+            Product("Телевизор", "4K LED экран", 30000, quantity)
+        self.assertEqual(len(tracer), 3)
+
+    def test_sampled_tracer_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            SampledTracer(RingBufferTracer(), every=0)
+
+    def test_logging_tracer(self):
+        logger = logging.getLogger("tests.tracing")
+        Product.set_creation_tracer(LoggingTracer(logger, logging.INFO))
+        with self.assertLogs(logger, logging.INFO) as logs:
+            Product("Телевизор", "4K LED экран", 30000, 15)
+        self.assertIn("Создан объект класса Product", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
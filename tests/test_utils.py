@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.products import Category
+from src.utils import iter_categories, iter_json_array, load_categories, load_json, load_shards, parse_shard
+from tests.helpers import CategoryCountersMixin
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "products.json")
+
+
+class TestStreamingLoader(CategoryCountersMixin, unittest.TestCase):
+    def write_temp(self, text):
+        file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="UTF-8")
+        with file:
+            file.write(text)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_matches_load_json(self):
+        """Потоковый разбор совпадает с json.load при любом размере блока."""
+        expected = load_json(DATA_PATH)
+        for chunk_size in (1, 7, 64, 1024 * 1024):
+            self.assertEqual(list(iter_json_array(DATA_PATH, chunk_size)), expected)
+
+    def test_empty_array(self):
+        path = self.write_temp("  [ ]  ")
+        self.assertEqual(list(iter_json_array(path, 2)), [])
+
+    def test_scalar_items_split_by_chunks(self):
+        path = self.write_temp("[12345, 6.5, \"строка\"]")
+        self.assertEqual(list(iter_json_array(path, 2)), [12345, 6.5, "строка"])
+
+    def test_item_much_larger_than_chunk(self):
+        """Большой элемент дочитывается с удвоением блока, а не разбирается заново на каждый блок."""
+        products = [
+            {"name": f"Товар {index}", "description": "256GB, Серый", "price": 100.0 + index, "quantity": 3}
+            for index in range(5000)
+        ]
+        data = [{"name": "Большая категория", "description": "", "products": products}, {"name": "Малая"}]
+        path = self.write_temp(json.dumps(data, ensure_ascii=False))
+        decode = json.JSONDecoder.raw_decode
+        with mock.patch.object(json.JSONDecoder, "raw_decode", autospec=True, side_effect=decode) as raw_decode:
+            self.assertEqual(list(iter_json_array(path, 64)), data)
+        # Файл больше блока в тысячи раз, повторных разборов — порядка логарифма
+        self.assertGreater(os.path.getsize(path), 3000 * 64)
+        self.assertLess(raw_decode.call_count, 40)
+
+    def test_not_an_array(self):
+        path = self.write_temp('{"name": "Смартфоны"}')
+        with self.assertRaises(ValueError):
+            list(iter_json_array(path))
+
+    def test_truncated_file(self):
+        path = self.write_temp('[{"name": "Смартфоны"}, {"name": ')
+        with self.assertRaises(ValueError):
+            list(iter_json_array(path, 4))
+
+    def test_iter_categories_yields_lazily(self):
+        categories = iter_categories(DATA_PATH, chunk_size=16)
+        first = next(categories)
+        self.assertIsInstance(first, Category)
+        self.assertEqual(first.name, "Смартфоны")
+        self.assertEqual([product.name for product in first][0], "Samsung Galaxy C23 Ultra")
+        self.assertEqual([category.name for category in categories], ["Телевизоры"])
+
+    def test_duplicate_products_are_merged(self):
+        data = [
+            {
+                "name": "Фрукты",
+                "description": "Разнообразные фрукты",
+                "products": [
+                    {"name": "Яблоко", "description": "Сочное яблоко", "price": 50, "quantity": 10},
+                    {"name": "Яблоко", "description": "Сочное яблоко", "price": 60, "quantity": 5},
+                ],
+            }
+        ]
+        path = self.write_temp(json.dumps(data, ensure_ascii=False))
+        (category,) = load_categories(path)
+        (apple,) = list(category)
+        self.assertEqual(apple.quantity, 15)
+        self.assertEqual(apple.price, 60)
+
+
+class TestShardedIngest(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.paths = []
+        for number in range(4):
+            products = [
+                {"name": f"Товар {index}", "description": f"Шард {number}", "price": 100 + number, "quantity": 1}
+                for index in range(number, number + 5)
+            ]
+            data = [
+                {"name": "Общая", "description": "Во всех шардах", "products": products},
+                {"name": f"Шард {number}", "description": "Своя категория", "products": products[:1] * 2},
+            ]
+            self.paths.append(self.write_shard(f"shard_{number}.json", data))
+
+    def write_shard(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="UTF-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        return path
+
+    @staticmethod
+    def dump(categories):
+        return [
+            (category.name, category.description, [(p.name, p.description, p.price, p.quantity) for p in category])
+            for category in categories
+        ]
+
+    def test_parse_shard_returns_compact_records(self):
+        shard = parse_shard(self.paths[1])
+        self.assertEqual(shard[1], ("Шард 1", "Своя категория", [("Товар 1", "Шард 1", 101, 2)]))
+
+    def test_merge_rules(self):
+        common = load_shards(self.paths, processes=1)[0]
+        products = {product.name: product for product in common}
+        self.assertEqual(len(products), 8)
+        self.assertEqual((products["Товар 3"].price, products["Товар 3"].quantity), (103, 4))
+        self.assertEqual(products["Товар 3"].description, "Шард 0")
+
+    def test_parallel_matches_serial(self):
+        serial = self.dump(load_shards(self.paths, processes=1))
+        parallel = self.dump(load_shards(self.paths, processes=2))
+        self.assertEqual(parallel, serial)
+
+    def test_fractional_quantity_matches_serial_load(self):
+        products = [{"name": "Сыр", "description": "Весовой", "price": 1000, "quantity": 1.5}] * 2
+        path = self.write_shard("weighed.json", [{"name": "Развес", "description": "На вес", "products": products}])
+        self.assertEqual(self.dump(load_shards([path], processes=1)), self.dump(load_categories(path)))
+        self.assertEqual(parse_shard(path)[0][2], [("Сыр", "Весовой", 1000, 3.0)])
+
+    def test_invalid_record(self):
+        data = [{"name": "Плохая", "products": [{"name": "Товар", "price": 0, "quantity": 1}]}]
+        path = self.write_shard("bad.json", data)
+        with self.assertRaises(ValueError):
+            load_shards([path, self.paths[0]], processes=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
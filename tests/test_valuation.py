@@ -0,0 +1,50 @@
+import unittest
+
+from src.products import Category, LawnGrass, Product, Smartphone
+from src.valuation import inventory_value
+from tests.helpers import CategoryCountersMixin
+
+
+class TestInventoryValue(CategoryCountersMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.smartphone1 = Smartphone(
+            "Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый"
+        )
+        self.smartphone2 = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+        self.grass = LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")
+
+    def test_add_same_subclass(self):
+        self.assertEqual(self.smartphone1 + self.smartphone2, 180000.0 * 5 + 210000.0 * 8)
+
+    def test_add_different_classes(self):
+        with self.assertRaises(TypeError):
+            self.smartphone1 + self.grass
+        with self.assertRaises(TypeError):
+            self.smartphone1 + Product("Чехол", "Силиконовый", 1000, 3)
+
+    def test_same_class_iterable(self):
+        self.assertEqual(inventory_value([self.smartphone1, self.smartphone2]), self.smartphone1 + self.smartphone2)
+        self.assertEqual(inventory_value([]), 0)
+
+    def test_category(self):
+        category = Category("Смартфоны", "Высокотехнологичные смартфоны", [])
+        category.add_product(self.smartphone1)
+        category.add_product(self.smartphone2)
+        self.assertEqual(inventory_value(category), category.stock_value())
+
+    def test_mixed_classes_rejected(self):
+        with self.assertRaises(TypeError):
+            inventory_value([self.smartphone1, self.grass])
+
+    def test_group_by_class(self):
+        totals = inventory_value([self.smartphone1, self.grass, self.smartphone2], by_class=True)
+        self.assertEqual(totals, {Smartphone: 180000.0 * 5 + 210000.0 * 8, LawnGrass: 500.0 * 20})
+
+    def test_non_product_rejected(self):
+        with self.assertRaises(TypeError):
+            inventory_value([self.smartphone1, "непродукт"])
+
+
+if __name__ == "__main__":
+    unittest.main()